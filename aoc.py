@@ -0,0 +1,166 @@
+"""
+Single entry point for running any day's solution, timing the parse, solve and output stages separately.
+
+Each day module exposes parse_puzzle(raw_data) and solve_part_1(puzzle) and/or solve_part_2(puzzle). A module that sets
+STREAM_INPUT = True is handed a lazy stream of lines rather than a list, so it can run in bounded memory. From the repo
+root:
+
+python -m aoc run 5 --part 2 --input dec_5/input.txt
+python -m aoc run all --format csv --output timings.csv
+"""
+import argparse
+import csv
+import importlib
+import json
+import os
+import sys
+from collections import namedtuple
+from contextlib import redirect_stdout
+from time import perf_counter
+from types import ModuleType
+from typing import Optional
+
+from common_functions import load_input, stream_input
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+# Checked in order when no input file is given - real inputs aren't committed, so fall back to the examples
+DEFAULT_INPUTS = ["input.txt", "input_a.txt", "example.txt", "example_a.txt"]
+
+Timing = namedtuple("Timing", "day part module input answer parse solve output status")
+
+
+def discover_days() -> list[int]:
+    """Find every dec_N directory in the repo and return the day numbers in order"""
+    days = []
+    for name in os.listdir(REPO_ROOT):
+        if name.startswith("dec_") and name[4:].isdigit():
+            days.append(int(name[4:]))
+    return sorted(days)
+
+
+def find_solver(day: int, part: int) -> Optional[ModuleType]:
+    """Import the modules for a given day and return the first that can solve the requested part"""
+    day_dir = os.path.join(REPO_ROOT, f"dec_{day}")
+    for filename in sorted(os.listdir(day_dir)):
+        if not (filename.startswith(f"dec_{day}") and filename.endswith(".py")):
+            continue
+        module = importlib.import_module(f"dec_{day}.{filename[:-3]}")
+        if hasattr(module, f"solve_part_{part}"):
+            return module
+    return None
+
+
+def find_input(day: int) -> Optional[str]:
+    """Return the first of the default input files that exists for a given day"""
+    for filename in DEFAULT_INPUTS:
+        path = os.path.join(REPO_ROOT, f"dec_{day}", filename)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def run_part(day: int, part: int, filename: Optional[str] = None) -> Timing:
+    """
+    Solve a single part of a single day, returning the answer with the time spent in each stage. Anything the solvers
+    print is sent to stderr so stdout stays machine readable. Streaming modules read and parse as they solve, so for
+    them the parse stage is only setting up the stream
+    """
+    module = find_solver(day, part)
+    filename = filename or find_input(day)
+    if module is None or filename is None:
+        status = "no solver" if module is None else "no input"
+        return Timing(day, part, None, filename, None, None, None, None, status)
+
+    try:
+        with redirect_stdout(sys.stderr):
+            start = perf_counter()
+            read = (
+                stream_input if getattr(module, "STREAM_INPUT", False) else load_input
+            )
+            puzzle = module.parse_puzzle(read(filename))
+            parsed = perf_counter()
+            answer = getattr(module, f"solve_part_{part}")(puzzle)
+            solved = perf_counter()
+    except Exception as e:
+        return Timing(
+            day,
+            part,
+            module.__name__,
+            filename,
+            None,
+            None,
+            None,
+            None,
+            f"error: {e!r}",
+        )
+
+    # The output stage is rendering the answer and writing it out for a human to read
+    print(f"Day {day} part {part}: {answer}", file=sys.stderr)
+    output = perf_counter()
+    return Timing(
+        day,
+        part,
+        module.__name__,
+        filename,
+        answer,
+        parsed - start,
+        solved - parsed,
+        output - solved,
+        "ok",
+    )
+
+
+def write_timings(timings: list[Timing], output_format: str, stream):
+    if output_format == "json":
+        json.dump([timing._asdict() for timing in timings], stream, indent=2)
+        stream.write("\n")
+    elif output_format == "csv":
+        writer = csv.DictWriter(stream, fieldnames=Timing._fields)
+        writer.writeheader()
+        writer.writerows(timing._asdict() for timing in timings)
+    else:
+        for timing in timings:
+            if timing.status != "ok":
+                print(
+                    f"Day {timing.day} part {timing.part}: {timing.status}", file=stream
+                )
+                continue
+            print(
+                f"Day {timing.day} part {timing.part}: {timing.answer} - parse {timing.parse:.4f}s, "
+                f"solve {timing.solve:.4f}s, output {timing.output:.4f}s",
+                file=stream,
+            )
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="aoc", description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="run one or all days")
+    run.add_argument("day", help="the day to run, or 'all'")
+    run.add_argument("--part", type=int, choices=[1, 2], help="defaults to both parts")
+    run.add_argument(
+        "--input", help="input file, defaults to the day's input or example file"
+    )
+    run.add_argument("--format", choices=["text", "json", "csv"], default="text")
+    run.add_argument(
+        "--output", help="write the timings to this file instead of stdout"
+    )
+    args = parser.parse_args(argv)
+
+    days = discover_days() if args.day == "all" else [int(args.day)]
+    parts = [args.part] if args.part else [1, 2]
+    if args.input and len(days) > 1:
+        parser.error("--input can only be used when running a single day")
+
+    timings = [run_part(day, part, args.input) for day in days for part in parts]
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            write_timings(timings, args.format, f)
+    else:
+        write_timings(timings, args.format, sys.stdout)
+    # Days without a solver or an input aren't failures, but anything that raised is
+    return int(any(timing.status.startswith("error") for timing in timings))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
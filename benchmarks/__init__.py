@@ -0,0 +1,4 @@
+"""
+Benchmarks for the shared helpers and the daily solutions, run from the repo root with e.g.
+python -m benchmarks.bench_load_input
+"""
@@ -0,0 +1,36 @@
+"""
+Compare walking every map in turn for each seed against a single lookup in the composed map, one seed at a time and as
+one batch, on the day 5 almanac at a scale of 10 with a million seeds
+
+python -m benchmarks.bench_almanac
+"""
+import random
+
+from benchmarks.generators import generate
+from benchmarks.harness import measure, print_measurements
+from dec_5.dec_5a import compose_maps, parse_puzzle
+from tests.reference import walk_maps
+
+
+def composed_lookups(seeds: list[int], composed) -> list[int]:
+    return [composed(seed) for seed in seeds]
+
+
+def composed_batch(seeds: list[int], composed) -> list[int]:
+    return composed.map_values(seeds)
+
+
+if __name__ == "__main__":
+    _, map_blocks = parse_puzzle(generate(5, 10))
+    rng = random.Random(2023)
+    seeds = [rng.randrange(2**32) for _ in range(1_000_000)]
+    composing = measure("compose_maps", compose_maps, map_blocks)
+    composed = composing.result
+    print(f"{len(composed)} segments")
+    results = [
+        measure("walk every map", walk_maps, seeds, map_blocks, repeat=1),
+        measure("composed map, one at a time", composed_lookups, seeds, composed),
+        measure("composed map, batch", composed_batch, seeds, composed),
+    ]
+    assert all(item.result == results[0].result for item in results)
+    print_measurements([composing] + results)
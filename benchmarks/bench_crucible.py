@@ -0,0 +1,51 @@
+"""
+Time the crucible search for both parts on a random heat loss map, 500x500 by default, with and without the A*
+heuristic
+
+python -m benchmarks.bench_crucible
+python -m benchmarks.bench_crucible --side 141 --repeat 3
+python -m benchmarks.bench_crucible --side 141 --memory
+"""
+import argparse
+import random
+
+from benchmarks.harness import measure, print_measurements
+from dec_17.dec_17 import dijkstra, parse_puzzle
+
+
+def crucible(grid, min_run: int, max_run: int, a_star: bool) -> int:
+    goal = (grid.height - 1, grid.width - 1)
+    heat_loss, _ = dijkstra(grid, (0, 0), goal, min_run, max_run, a_star=a_star)
+    return heat_loss
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the crucible search")
+    parser.add_argument("--side", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument(
+        "--memory", action="store_true", help="also trace peak memory - much slower"
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(2023)
+    rows = ["".join(rng.choices("123456789", k=args.side)) for _ in range(args.side)]
+    grid = parse_puzzle(rows)
+    results = []
+    for part, (min_run, max_run) in [(1, (1, 3)), (2, (4, 10))]:
+        for a_star in (False, True):
+            name = f"part {part} {'A*' if a_star else 'Dijkstra'}"
+            results.append(
+                measure(
+                    name,
+                    crucible,
+                    grid,
+                    min_run,
+                    max_run,
+                    a_star,
+                    repeat=args.repeat,
+                    memory=args.memory or None,
+                )
+            )
+        assert results[-1].result == results[-2].result
+    print_measurements(results)
@@ -0,0 +1,85 @@
+"""
+Run every day's solutions on generated inputs at increasing scales, reporting run time and throughput, and peak
+memory when asked for with --memory or AOC_BENCH_MEMORY.
+
+python -m benchmarks.bench_days
+python -m benchmarks.bench_days --days 12 16 17 --scales 1 10 100 --budget 60
+python -m benchmarks.bench_days --days 16 --scales 10 --memory
+
+Larger scales of a day are skipped once a smaller one takes longer than the time budget, so slow solutions can't stall
+the whole run.
+"""
+import argparse
+import os
+from contextlib import redirect_stdout
+
+from aoc import discover_days, find_solver
+from benchmarks.generators import generate
+from benchmarks.harness import format_peak, measure
+
+DEFAULT_SCALES = [1, 10, 100]
+
+
+def solve(module, part: int, raw_data: list[str]):
+    """Parse and solve from scratch, since some solvers modify the parsed puzzle as they go"""
+    puzzle = module.parse_puzzle(raw_data.copy())
+    return getattr(module, f"solve_part_{part}")(puzzle)
+
+
+def benchmark_part(
+    day: int, part: int, scales: list[int], budget: float, repeat: int, memory=None
+):
+    module = find_solver(day, part)
+    if module is None:
+        return
+    for scale in scales:
+        raw_data = generate(day, scale)
+        size = sum(len(row) + 1 for row in raw_data)
+        try:
+            # Throw away anything the solvers print so terminal I/O doesn't dominate the timings
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                result = measure(
+                    f"{day}.{part}",
+                    solve,
+                    module,
+                    part,
+                    raw_data,
+                    repeat=repeat,
+                    memory=memory,
+                )
+        except Exception as e:
+            print(f"{day:>4}{part:>6}{scale:>7}x  error: {e!r}")
+            return
+        print(
+            f"{day:>4}{part:>6}{scale:>7}x{len(raw_data):>10}{result.seconds:>12.4f}"
+            f"{len(raw_data) / result.seconds:>14.0f}{size / 2**20 / result.seconds:>10.2f}"
+            f"{format_peak(result.peak_bytes):>12}"
+        )
+        if result.seconds > budget:
+            print(f"{day:>4}{part:>6}  skipping larger scales - over {budget}s budget")
+            return
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark solutions on generated inputs"
+    )
+    parser.add_argument("--days", type=int, nargs="+", default=discover_days())
+    parser.add_argument("--parts", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES)
+    parser.add_argument("--budget", type=float, default=10, help="seconds per run")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument(
+        "--memory", action="store_true", help="also trace peak memory - much slower"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'day':>4}{'part':>6}{'scale':>8}{'lines':>10}{'seconds':>12}"
+        f"{'lines/s':>14}{'MiB/s':>10}{'peak MiB':>12}"
+    )
+    for day in args.days:
+        for part in args.parts:
+            benchmark_part(
+                day, part, args.scales, args.budget, args.repeat, args.memory or None
+            )
@@ -0,0 +1,48 @@
+"""
+Compare the original read-everything load_input with the mmap backed stream_input on a large line based file
+"""
+import os
+import random
+import tempfile
+
+from benchmarks.harness import measure, print_measurements
+from common_functions import load_input, stream_input
+
+
+def original_load_input(filename: str) -> list:
+    """The load_input implementation as it was before stream_input existed"""
+    with open(filename, "r") as f:
+        contents = f.read().split("\n")[:-1]
+    return contents
+
+
+def count_digits(lines) -> int:
+    """A stand-in for a line based solution - touches every line once without keeping it"""
+    return sum(len(line) for line in lines)
+
+
+def write_sample_file(filename: str, line_count: int, seed=2023):
+    rng = random.Random(seed)
+    with open(filename, "w") as f:
+        for _ in range(line_count):
+            f.write(" ".join(str(rng.randint(-1000, 1000)) for _ in range(21)) + "\n")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "input.txt")
+        write_sample_file(path, 200_000)
+        print(f"Sample file: {os.path.getsize(path) / 2**20:.1f} MiB")
+        results = [
+            measure(
+                "original load_input", lambda: count_digits(original_load_input(path))
+            ),
+            measure("load_input", lambda: count_digits(load_input(path))),
+            measure("stream_input", lambda: count_digits(stream_input(path))),
+            measure(
+                "stream_input(as_bytes=True)",
+                lambda: count_digits(stream_input(path, as_bytes=True)),
+            ),
+        ]
+        assert len({item.result for item in results}) == 1
+        print_measurements(results)
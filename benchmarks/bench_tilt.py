@@ -0,0 +1,36 @@
+"""
+Compare spin cycles of the bitboard Platform with the original string based cycle_rocks on a 1000x1000 platform
+
+python -m benchmarks.bench_tilt
+"""
+from benchmarks.generators import generate
+from benchmarks.harness import measure, print_measurements
+from dec_14.dec_14 import Platform
+from tests.reference import cycle_rocks
+
+CYCLES = 3
+
+
+def run_string_cycles(puzzle: list[str]) -> list[str]:
+    for _ in range(CYCLES):
+        puzzle = cycle_rocks(puzzle)
+    return puzzle
+
+
+def run_platform_cycles(puzzle: list[str]) -> list[str]:
+    platform = Platform(puzzle)
+    state = platform.start
+    for _ in range(CYCLES):
+        state = platform.spin_cycle(state)
+    return platform.to_rows(state.rounded)
+
+
+if __name__ == "__main__":
+    # A scale of 100 makes the day 14 platform 1000x1000
+    grid = generate(14, 100)
+    results = [
+        measure(f"cycle_rocks x{CYCLES}", run_string_cycles, grid, repeat=1),
+        measure(f"Platform.spin_cycle x{CYCLES}", run_platform_cycles, grid),
+    ]
+    assert results[0].result == results[1].result
+    print_measurements(results)
@@ -0,0 +1,58 @@
+"""
+Compare solve times with tracing off against tracing on, where every trace point formats its message and writes it out
+as the old print based debugging did. Each run is a separate runner process, since AOC_TRACE is read at import.
+
+python -m benchmarks.bench_tracing --days 4 9 15 16 --scale 10
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.generators import generate
+
+
+def run_day(day: int, part: int, filename: str, trace: bool) -> float:
+    env = dict(os.environ)
+    env.pop("AOC_TRACE", None)
+    if trace:
+        env["AOC_TRACE"] = "1"
+    # The trace goes to a real file rather than /dev/null so the cost of writing it is included
+    with tempfile.TemporaryFile() as trace_output:
+        result = subprocess.run(
+            [sys.executable, "-m", "aoc", "run", str(day), "--part", str(part)]
+            + ["--input", filename, "--format", "json"],
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=trace_output,
+            check=True,
+        )
+    timing = json.loads(result.stdout)[0]
+    if timing["status"] != "ok":
+        raise RuntimeError(timing["status"])
+    return timing["solve"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark tracing on and off")
+    parser.add_argument("--days", type=int, nargs="+", default=[4, 9, 15, 16])
+    parser.add_argument("--parts", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--scale", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'day':>4}{'part':>6}{'trace off s':>14}{'trace on s':>14}{'speedup':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for day in args.days:
+            path = os.path.join(directory, f"day_{day}.txt")
+            with open(path, "w") as f:
+                f.writelines(row + "\n" for row in generate(day, args.scale))
+            for part in args.parts:
+                try:
+                    off = run_day(day, part, path, trace=False)
+                    on = run_day(day, part, path, trace=True)
+                except RuntimeError as e:
+                    print(f"{day:>4}{part:>6}  {e}")
+                    continue
+                print(f"{day:>4}{part:>6}{off:>14.4f}{on:>14.4f}{on / off:>9.1f}x")
@@ -0,0 +1,42 @@
+"""
+Compare the original nested loop transpose with transpose_data, with and without NumPy, on a 1000x1000 grid
+
+python -m benchmarks.bench_transpose
+"""
+import common_functions
+from benchmarks.generators import generate
+from benchmarks.harness import measure, print_measurements
+from common_functions import transpose_data
+
+
+def original_transpose_data(row_based_data: list[str]) -> list[str]:
+    """The transpose_data implementation as it was before this benchmark existed"""
+    result = []
+    for i in range(len(row_based_data[0])):
+        temp_list = []
+        for j in range(len(row_based_data)):
+            temp_list.append(row_based_data[j][i])
+        result.append("".join(temp_list))
+    return result
+
+
+def transpose_without_numpy(row_based_data: list[str]) -> list[str]:
+    numpy = common_functions.numpy
+    common_functions.numpy = None
+    try:
+        return transpose_data(row_based_data)
+    finally:
+        common_functions.numpy = numpy
+
+
+if __name__ == "__main__":
+    # A scale of 100 makes the day 14 platform 1000x1000
+    grid = generate(14, 100)
+    results = [
+        measure("original transpose_data", original_transpose_data, grid),
+        measure("transpose_data (zip)", transpose_without_numpy, grid),
+    ]
+    if common_functions.numpy is not None:
+        results.append(measure("transpose_data (NumPy)", transpose_data, grid))
+    assert all(item.result == results[0].result for item in results)
+    print_measurements(results)
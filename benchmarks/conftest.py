@@ -0,0 +1,37 @@
+"""
+Collects the measurements taken by the day benchmarks and prints them as a table at the end of the pytest run
+"""
+import pytest
+
+from benchmarks.harness import format_peak, Measurement
+
+MEASUREMENTS = []
+
+
+@pytest.fixture
+def record_measurement(record_property):
+    """Keep a measurement for the summary table, and attach it to the test for --junitxml reports"""
+
+    def record(measurement: Measurement, lines: int, size: int):
+        MEASUREMENTS.append((measurement, lines, size))
+        record_property("seconds", measurement.seconds)
+        record_property("lines_per_second", lines / measurement.seconds)
+        if measurement.peak_bytes is not None:
+            record_property("peak_mib", measurement.peak_bytes / 2**20)
+
+    return record
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not MEASUREMENTS:
+        return
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(
+        f"{'name':<20}{'lines':>10}{'seconds':>12}{'lines/s':>14}{'MiB/s':>10}{'peak MiB':>12}"
+    )
+    for measurement, lines, size in MEASUREMENTS:
+        terminalreporter.write_line(
+            f"{measurement.name:<20}{lines:>10}{measurement.seconds:>12.4f}"
+            f"{lines / measurement.seconds:>14.0f}{size / 2**20 / measurement.seconds:>10.2f}"
+            f"{format_peak(measurement.peak_bytes):>12}"
+        )
@@ -0,0 +1,370 @@
+"""
+Seeded generators for synthetic puzzle inputs of any size. Each generator takes a scale and a Random instance and
+returns the input as a list of lines, in the same format load_input would give for that day.
+
+A scale of 1 is roughly the size of a real puzzle input. Line based inputs grow linearly with the scale and grids grow
+in area, so a scale of 100 means 100 times as many lines or cells.
+
+To write an input out for use with the runner:
+python -m benchmarks.generators 16 --scale 10 > dec_16/input.txt
+"""
+import argparse
+import random
+import string
+from math import isqrt
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+CARDS = "AKQJT98765432"
+HEX_DIRECTIONS = {"R": 0, "D": 1, "L": 2, "U": 3}
+# The pipe for each pair of connections a loop tile makes, with bits for north, east, south and west in that order
+LOOP_PIPES = {
+    0b0011: "L",
+    0b0101: "|",
+    0b1001: "J",
+    0b0110: "F",
+    0b1010: "-",
+    0b1100: "7",
+}
+
+
+def grid_side(base: int, scale: int) -> int:
+    """Grids grow in area, so each side grows with the square root of the scale"""
+    return max(2, isqrt(base * base * scale))
+
+
+def split_evenly(total: int, parts: int) -> list[int]:
+    """Split a total into a number of positive parts that differ by at most one"""
+    size, remainder = divmod(total, parts)
+    return [size + 1] * remainder + [size] * (parts - remainder)
+
+
+def generate_calibration_document(scale: int, rng: random.Random) -> list[str]:
+    rows = []
+    for _ in range(1000 * scale):
+        chunks = [rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 12))]
+        chunks += rng.sample(DIGIT_WORDS, 2)
+        # Every line needs at least one real digit for part 1
+        chunks.append(str(rng.randint(1, 9)))
+        rng.shuffle(chunks)
+        rows.append("".join(chunks))
+    return rows
+
+
+def generate_cube_games(scale: int, rng: random.Random) -> list[str]:
+    rows = []
+    for game in range(1, 100 * scale + 1):
+        rounds = []
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            rounds.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colours))
+        rows.append(f"Game {game}: " + "; ".join(rounds))
+    return rows
+
+
+def generate_engine_schematic(scale: int, rng: random.Random) -> list[str]:
+    side = grid_side(140, scale)
+    rows = []
+    for _ in range(side):
+        row = []
+        while len(row) < side:
+            roll = rng.random()
+            if roll < 0.1:
+                row.extend(str(rng.randint(1, 999)))
+            elif roll < 0.13:
+                row.append(rng.choice("*#+$/=%@&-"))
+            row.append(".")
+        rows.append("".join(row[:side]))
+    return rows
+
+
+def generate_scratchcards(scale: int, rng: random.Random) -> list[str]:
+    rows = []
+    for card in range(1, 200 * scale + 1):
+        winning = rng.sample(range(1, 100), 10)
+        playing = rng.sample(range(1, 100), 25)
+        rows.append(
+            f"Card {card:>4}: "
+            + " ".join(f"{i:>2}" for i in winning)
+            + " | "
+            + " ".join(f"{i:>2}" for i in playing)
+        )
+    return rows
+
+
+def generate_almanac(scale: int, rng: random.Random) -> list[str]:
+    names = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity"]
+    names.append("location")
+    seeds = []
+    for _ in range(10 * scale):
+        seeds += [rng.randrange(2**32), rng.randint(1, 2**28)]
+    rows = ["seeds: " + " ".join(str(i) for i in seeds), ""]
+    for source, destination in zip(names, names[1:]):
+        rows.append(f"{source}-to-{destination} map:")
+        # Carve the source space into adjacent blocks and send each one somewhere random
+        start = rng.randrange(2**28)
+        for _ in range(40 * scale):
+            length = rng.randint(1, 2**26)
+            rows.append(f"{rng.randrange(2**32 - length)} {start} {length}")
+            start += length + rng.randrange(2**20)
+        rows.append("")
+    return rows[:-1]
+
+
+def generate_races(scale: int, rng: random.Random) -> list[str]:
+    # Part 2 joins every time together and tries each one, so here the scale adds digits rather than races
+    digits = len(str(scale))
+    times = [rng.randint(10 ** (digits - 1) + 1, 10**digits) for _ in range(3)]
+    distances = [rng.randint(0, t * t // 4 - 1) for t in times]
+    return [
+        "Time:      " + " ".join(f"{t:>4}" for t in times),
+        "Distance:  " + " ".join(f"{d:>4}" for d in distances),
+    ]
+
+
+def generate_camel_hands(scale: int, rng: random.Random) -> list[str]:
+    return [
+        "".join(rng.choice(CARDS) for _ in range(5)) + f" {rng.randint(1, 1000)}"
+        for _ in range(1000 * scale)
+    ]
+
+
+def generate_network(scale: int, rng: random.Random) -> list[str]:
+    """
+    A handful of separate chains, each from a node ending in A round a loop through a node ending in Z. Chain lengths
+    are whole multiples of the instructions so the Z nodes are reached at the end of a pass, as in the real puzzle
+    """
+    instructions = "".join(rng.choice("LR") for _ in range(rng.randint(40, 60)))
+    rows = [instructions, ""]
+    node_id = 0
+    for chain in range(6):
+        start, end = ("AAA", "ZZZ") if chain == 0 else (f"{chain}XA", f"{chain}XZ")
+        middle = []
+        for _ in range(rng.randint(10, 20) * scale * len(instructions) - 1):
+            middle.append(f"N{node_id:06d}")
+            node_id += 1
+        chain_nodes = [start] + middle + [end]
+        for node, next_node in zip(chain_nodes, chain_nodes[1:]):
+            rows.append(f"{node} = ({next_node}, {next_node})")
+        # Loop back round to the first node after the start
+        rows.append(f"{end} = ({chain_nodes[1]}, {chain_nodes[1]})")
+    return rows
+
+
+def generate_oasis_report(scale: int, rng: random.Random) -> list[str]:
+    rows = []
+    for _ in range(200 * scale):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 6))]
+        values = [
+            sum(c * x**power for power, c in enumerate(coefficients))
+            for x in range(21)
+        ]
+        rows.append(" ".join(str(v) for v in values))
+    return rows
+
+
+def fill_squares(
+    squares: list[bytearray], top: int, left: int, height: int, width: int
+):
+    for row in squares[top : top + height]:
+        row[left : left + width] = b"\x01" * width
+
+
+def generate_pipe_maze(scale: int, rng: random.Random) -> list[str]:
+    """
+    A loop round the outline of a random tree of 2x2 blocks, so it winds across most of the grid and encloses the
+    middle of every block and corridor. The loop runs through the tile centres, making it the boundary of a set of unit
+    squares with tile centres at their corners. S goes on a random tile of the loop and every other tile is random
+    """
+    side = grid_side(140, scale)
+    # Square (y, x) has the centres of tiles (y, x) and (y + 1, x + 1) at opposite corners. Blocks sit every 3 squares
+    # from 1, so the last row and column of squares stay empty and reading squares[-1] or row[-1] finds nothing
+    squares = [bytearray(side) for _ in range(side)]
+    nodes = (side - 5) // 3 + 1
+    node = (rng.randrange(nodes), rng.randrange(nodes))
+    fill_squares(squares, 1 + 3 * node[0], 1 + 3 * node[1], 2, 2)
+    visited = {node}
+    stack = [node]
+    while stack:
+        (a, b) = stack[-1]
+        options = [
+            (a + da, b + db)
+            for da, db in ((0, 1), (1, 0), (0, -1), (-1, 0))
+            if 0 <= a + da < nodes
+            and 0 <= b + db < nodes
+            and (a + da, b + db) not in visited
+        ]
+        if not options:
+            stack.pop()
+            continue
+        (c, d) = rng.choice(options)
+        (top, left) = (1 + 3 * min(a, c), 1 + 3 * min(b, d))
+        fill_squares(squares, 1 + 3 * c, 1 + 3 * d, 2, 2)
+        # Bridge the one square gap between the two blocks
+        if a == c:
+            fill_squares(squares, top, left + 2, 2, 1)
+        else:
+            fill_squares(squares, top + 2, left, 1, 2)
+        visited.add((c, d))
+        stack.append((c, d))
+    rows = []
+    loop = []
+    for i in range(side):
+        (above, below) = (squares[i - 1], squares[i])
+        row = []
+        for j in range(side):
+            # A tile connects in each direction where the squares either side of that edge differ
+            connections = (
+                (above[j - 1] ^ above[j])
+                | (above[j] ^ below[j]) << 1
+                | (below[j - 1] ^ below[j]) << 2
+                | (above[j - 1] ^ below[j - 1]) << 3
+            )
+            if connections:
+                row.append(LOOP_PIPES[connections])
+                loop.append((i, j))
+            else:
+                row.append(rng.choice("|-LJ7F..."))
+        rows.append(row)
+    (i, j) = rng.choice(loop)
+    rows[i][j] = "S"
+    return ["".join(row) for row in rows]
+
+
+def generate_galaxy_image(scale: int, rng: random.Random) -> list[str]:
+    side = grid_side(140, scale)
+    empty_rows = set(rng.sample(range(side), side // 20))
+    empty_cols = set(rng.sample(range(side), side // 20))
+    return [
+        "".join(
+            "#"
+            if i not in empty_rows and j not in empty_cols and rng.random() < 0.02
+            else "."
+            for j in range(side)
+        )
+        for i in range(side)
+    ]
+
+
+def generate_spring_records(scale: int, rng: random.Random) -> list[str]:
+    rows = []
+    for _ in range(1000 * scale):
+        groups = [rng.randint(1, 5) for _ in range(rng.randint(1, 6))]
+        # Lay out a valid arrangement, then hide some of the springs behind question marks
+        springs = "." * rng.randint(0, 2)
+        for group in groups:
+            springs += "#" * group + "." * rng.randint(1, 3)
+        springs = "".join(c if rng.random() < 0.4 else "?" for c in springs)
+        rows.append(f"{springs} {','.join(str(g) for g in groups)}")
+    return rows
+
+
+def generate_mirror_patterns(scale: int, rng: random.Random) -> list[str]:
+    rows = []
+    for _ in range(100 * scale):
+        height = rng.randint(7, 17)
+        width = rng.randint(7, 17)
+        # Build half a pattern and reflect it, trimming the far side so the mirror line isn't always central
+        mirror = rng.randint(1, height - 1)
+        half = ["".join(rng.choice("#.") for _ in range(width)) for _ in range(mirror)]
+        pattern = (half + half[::-1])[:height]
+        while len(pattern) < height:
+            pattern.append("".join(rng.choice("#.") for _ in range(width)))
+        if rng.random() < 0.5:
+            pattern = ["".join(column) for column in zip(*pattern)]
+        rows += pattern + [""]
+    return rows[:-1]
+
+
+def generate_rock_platform(scale: int, rng: random.Random) -> list[str]:
+    side = grid_side(100, scale)
+    return [
+        "".join(rng.choices("O#.", weights=[2, 1.5, 6.5], k=side)) for _ in range(side)
+    ]
+
+
+def generate_lens_sequence(scale: int, rng: random.Random) -> list[str]:
+    labels = [
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 6)))
+        for _ in range(500)
+    ]
+    steps = []
+    for _ in range(4000 * scale):
+        label = rng.choice(labels)
+        steps.append(
+            f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}"
+        )
+    return [",".join(steps)]
+
+
+def generate_mirror_grid(scale: int, rng: random.Random) -> list[str]:
+    side = grid_side(110, scale)
+    return [
+        "".join(rng.choices(".|-/\\", weights=[90, 2.5, 2.5, 2.5, 2.5], k=side))
+        for _ in range(side)
+    ]
+
+
+def generate_heat_loss_map(scale: int, rng: random.Random) -> list[str]:
+    side = grid_side(141, scale)
+    return ["".join(rng.choices("123456789", k=side)) for _ in range(side)]
+
+
+def generate_dig_plan(scale: int, rng: random.Random) -> list[str]:
+    """
+    A staircase running right and down from the origin, closed off by edges back along the bottom and up the left hand
+    side. The hex colours encode a second, much larger staircase of the same shape for part 2
+    """
+    steps = 350 * scale
+    plan = [[], []]
+    for part, max_distance in enumerate([10, 0xFFFFF // 8]):
+        for _ in range(steps):
+            plan[part].append(("R", rng.randint(1, max_distance)))
+            plan[part].append(("D", rng.randint(1, max_distance)))
+    # Split the closing edges into chunks so every distance still fits in five hex digits
+    widths = [sum(d for direction, d in part if direction == "R") for part in plan]
+    heights = [sum(d for direction, d in part if direction == "D") for part in plan]
+    chunks = -(-max(widths + heights) // 0xFFFFF)
+    for part in range(2):
+        plan[part] += [("L", d) for d in split_evenly(widths[part], chunks)]
+        plan[part] += [("U", d) for d in split_evenly(heights[part], chunks)]
+    return [
+        f"{direction} {metres} (#{hex_metres:05x}{HEX_DIRECTIONS[hex_direction]})"
+        for (direction, metres), (hex_direction, hex_metres) in zip(*plan)
+    ]
+
+
+GENERATORS = {
+    1: generate_calibration_document,
+    2: generate_cube_games,
+    3: generate_engine_schematic,
+    4: generate_scratchcards,
+    5: generate_almanac,
+    6: generate_races,
+    7: generate_camel_hands,
+    8: generate_network,
+    9: generate_oasis_report,
+    10: generate_pipe_maze,
+    11: generate_galaxy_image,
+    12: generate_spring_records,
+    13: generate_mirror_patterns,
+    14: generate_rock_platform,
+    15: generate_lens_sequence,
+    16: generate_mirror_grid,
+    17: generate_heat_loss_map,
+    18: generate_dig_plan,
+}
+
+
+def generate(day: int, scale=1, seed=2023) -> list[str]:
+    """Generate the input for a given day at a given scale - the same seed always gives the same input"""
+    return GENERATORS[day](scale, random.Random(seed))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Print a synthetic input for a day")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=2023)
+    args = parser.parse_args()
+    for line in generate(args.day, args.scale, args.seed):
+        print(line)
@@ -0,0 +1,48 @@
+"""
+Small helpers for timing a function and, when AOC_BENCH_MEMORY is set in the environment, recording its peak memory use
+"""
+import os
+import tracemalloc
+from collections import namedtuple
+from time import perf_counter
+from typing import Callable, Optional
+
+Measurement = namedtuple("Measurement", "name seconds peak_bytes result")
+
+# Tracing allocations slows allocation heavy code down by as much as 40x, so the memory pass only runs when asked for
+TRACE_MEMORY = bool(os.environ.get("AOC_BENCH_MEMORY"))
+
+
+def measure(name: str, func: Callable, *args, repeat=3, memory=None) -> Measurement:
+    """
+    Run func(*args) repeat times, returning the best wall time. If memory is set, or by default if AOC_BENCH_MEMORY is,
+    peak memory is traced on a separate run so the tracing overhead doesn't skew the timings. Otherwise the peak is
+    None
+    """
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = perf_counter()
+        result = func(*args)
+        elapsed = perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    peak = None
+    if TRACE_MEMORY if memory is None else memory:
+        tracemalloc.start()
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return Measurement(name, best, peak, result)
+
+
+def format_peak(peak_bytes: Optional[int]) -> str:
+    """Peak memory in MiB, or a dash when it wasn't measured"""
+    return "-" if peak_bytes is None else f"{peak_bytes / 2**20:.2f}"
+
+
+def print_measurements(measurements: list[Measurement]):
+    """Print a list of measurements as an aligned table"""
+    print(f"{'name':<40}{'seconds':>12}{'peak MiB':>12}")
+    for item in measurements:
+        print(f"{item.name:<40}{item.seconds:>12.4f}{format_peak(item.peak_bytes):>12}")
@@ -0,0 +1,59 @@
+"""
+Run every day's solutions on generated inputs at each scale under pytest, reporting run time and throughput in a
+table at the end of the run. Only runs when AOC_BENCH_SCALES is set, so the tests stay quick. Peak memory is only
+traced when AOC_BENCH_MEMORY is set too, as tracing slows the runs down several times over
+
+AOC_BENCH_SCALES="1 10 100" python -m pytest -q benchmarks
+AOC_BENCH_SCALES=10 python -m pytest -q benchmarks -k "day16 or day17"
+AOC_BENCH_SCALES=100 AOC_BENCH_BUDGET=60 python -m pytest -q benchmarks
+AOC_BENCH_SCALES=10 AOC_BENCH_MEMORY=1 python -m pytest -q benchmarks
+
+As with bench_days, larger scales of a part are skipped once a smaller one takes longer than the time budget.
+"""
+import os
+from contextlib import redirect_stdout
+
+import pytest
+
+from aoc import discover_days, find_solver
+from benchmarks.bench_days import solve
+from benchmarks.generators import generate
+from benchmarks.harness import measure
+
+SCALES = [int(scale) for scale in os.environ.get("AOC_BENCH_SCALES", "").split()]
+BUDGET = float(os.environ.get("AOC_BENCH_BUDGET", 10))
+
+pytestmark = pytest.mark.skipif(
+    not SCALES, reason="set AOC_BENCH_SCALES to run the benchmarks"
+)
+
+# Parts that went over the budget at a smaller scale, keyed by (day, part)
+over_budget = set()
+
+CASES = [
+    (day, part, scale)
+    for day in discover_days()
+    for part in (1, 2)
+    for scale in sorted(SCALES)
+    if find_solver(day, part) is not None
+]
+
+
+@pytest.mark.parametrize(
+    "day, part, scale",
+    CASES,
+    ids=[f"day{day}-part{part}-{scale}x" for day, part, scale in CASES],
+)
+def test_day(day: int, part: int, scale: int, record_measurement):
+    if (day, part) in over_budget:
+        pytest.skip(f"over the {BUDGET}s budget at a smaller scale")
+    module = find_solver(day, part)
+    raw_data = generate(day, scale)
+    # Throw away anything the solvers print so terminal I/O doesn't dominate the timings
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        result = measure(
+            f"{day}.{part} {scale}x", solve, module, part, raw_data, repeat=1
+        )
+    record_measurement(result, len(raw_data), sum(len(row) + 1 for row in raw_data))
+    if result.seconds > BUDGET:
+        over_budget.add((day, part))
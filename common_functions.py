@@ -1,13 +1,88 @@
 """
 Reusable functions for loading input and so on
 """
+import logging
+import mmap
+import os
+from collections import namedtuple
+from typing import Any, Callable, Hashable, Iterator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Debug output from the solutions is only formatted and written when AOC_TRACE is set in the environment. Loops check
+# TRACE before calling their logger, so with tracing off a trace point costs one global lookup and a branch
+TRACE = bool(os.environ.get("AOC_TRACE"))
+if TRACE:
+    logging.basicConfig(level=logging.DEBUG, format="%(name)s: %(message)s")
+# How many processes a solution may spread its work over, for the few that can - one keeps everything in process
+WORKERS = int(os.environ.get("AOC_WORKERS") or 1)
+
+# Below this many cells the overhead of handing a grid to NumPy outweighs the faster transpose
+NUMPY_MIN_CELLS = 10_000
+
+CycleResult = namedtuple("CycleResult", "prefix period state")
+
+# Translation table to turn ASCII digits into their integer values in a single pass
+DIGIT_TABLE = bytes((i - ord("0")) % 256 for i in range(256))
+
+
+def stream_input(
+    filename: str, as_bytes=False
+) -> Iterator[str] or Iterator[memoryview]:
+    """
+    Given a filename, lazily yield its lines (without the trailing newline, or carriage return for files with Windows
+    line endings) from a memory map so the whole file is never held in memory at once.
+    :param filename: the file to read
+    :param as_bytes: if True, yield zero-copy memoryview slices of the mapped file rather than decoded strings. Any view
+    that is kept pins the whole mapping in memory, so copy it with bytes() if it needs to outlive the loop
+    :return: an iterator over the lines of the file
+    """
+    with open(filename, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped, and have no lines to yield anyway
+            return
+    view = memoryview(mapped)
+    size = len(mapped)
+    start = 0
+    try:
+        while start < size:
+            end = mapped.find(b"\n", start)
+            if end == -1:
+                end = size
+            line_end = end - 1 if end > start and mapped[end - 1] == 13 else end
+            yield view[start:line_end] if as_bytes else mapped[start:line_end].decode()
+            start = end + 1
+    finally:
+        view.release()
+        try:
+            mapped.close()
+        except BufferError:
+            # A caller is still holding a slice - the map is released when that slice is garbage collected
+            pass
 
 
 def load_input(filename: str) -> list:
-    """Given a filename load it and return its contents as a list, with each item representing a line"""
-    with open(filename, "r") as f:
-        contents = f.read().split("\n")[:-1]
-    return contents
+    """
+    Given a filename load it and return its contents as a list, with each item representing a line. The whole file is
+    read and split in one call, which is faster than collecting stream_input when every line is wanted anyway. Lines
+    are split the same way too, only on line feeds with a carriage return before one dropped, so the two always agree
+    """
+    with open(filename, "rb") as f:
+        text = f.read().decode()
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
+    lines = text.split("\n")
+    # A final line feed ends the last line rather than starting an empty one
+    if not lines[-1]:
+        lines.pop()
+    elif lines[-1][-1] == "\r":
+        lines[-1] = lines[-1][:-1]
+    return lines
 
 
 def parse_data_on_empty_rows(raw_data: list[str]) -> list[list[str]]:
@@ -28,13 +103,97 @@ def parse_data_on_empty_rows(raw_data: list[str]) -> list[list[str]]:
 
 def transpose_data(row_based_data: list[str]) -> list[str]:
     """Given a grid of strings, return the same grid transformed into columns instead of rows"""
-    result = []
-    for i in range(len(row_based_data[0])):
-        temp_list = []
-        for j in range(len(row_based_data)):
-            temp_list.append(row_based_data[j][i])
-        result.append("".join(temp_list))
-    return result
+    height = len(row_based_data)
+    width = len(row_based_data[0])
+    if numpy is not None and height * width >= NUMPY_MIN_CELLS:
+        # Let NumPy shuffle the bytes, then cut the result back up into strings
+        cells = numpy.frombuffer("".join(row_based_data).encode(), dtype=numpy.uint8)
+        columns = cells.reshape(height, width).T.tobytes().decode()
+        return [columns[i : i + height] for i in range(0, height * width, height)]
+    return ["".join(column) for column in zip(*row_based_data)]
+
+
+def find_cycle(
+    state: Any,
+    step: Callable[[Any], Any],
+    iterations: int,
+    key: Callable[[Any], Hashable] = None,
+) -> CycleResult:
+    """
+    Apply a deterministic step function to a state until a state repeats, then use the cycle to project the state after
+    any number of iterations without running them all.
+    :param state: the starting state
+    :param step: a function taking a state and returning the next one
+    :param iterations: how many times the step would be applied
+    :param key: turns a state into something hashable, for states such as lists that aren't. This can be a cheap
+    fingerprint that several states share, as states with the same key are compared in full before calling it a cycle
+    :return: the number of steps before the cycle starts, the length of the cycle (0 if the iterations run out before
+    anything repeats) and the state after all the iterations
+    """
+    key = key or (lambda s: s)
+    seen = {key(state): [0]}
+    history = [state]
+    for i in range(1, iterations + 1):
+        state = step(state)
+        state_key = key(state)
+        for prefix in seen.get(state_key, ()):
+            if history[prefix] == state:
+                period = i - prefix
+                return CycleResult(
+                    prefix, period, history[prefix + (iterations - prefix) % period]
+                )
+        seen.setdefault(state_key, []).append(i)
+        history.append(state)
+    return CycleResult(iterations, 0, state)
+
+
+def strongly_connected_components(successors: dict) -> list[list]:
+    """
+    Split a directed graph into strongly connected components using Tarjan's algorithm, with an explicit stack rather
+    than recursion so large graphs can't hit the recursion limit.
+    :param successors: maps every node to the nodes it has edges to
+    :return: the components in reverse topological order, so each one comes after every component it leads to
+    """
+    order = {}
+    low = {}
+    stack = []
+    on_stack = set()
+    components = []
+
+    def visit(node):
+        order[node] = low[node] = len(order)
+        stack.append(node)
+        on_stack.add(node)
+        work.append((node, iter(successors[node])))
+
+    for root in successors:
+        if root in order:
+            continue
+        work = []
+        visit(root)
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in order:
+                    visit(child)
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], order[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == order[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
 
 
 def transform_data_to_dict_grid(raw_data: list[str]) -> dict:
@@ -69,19 +228,56 @@ class Tile(object):
 
 
 class Grid(object):
-    """An x/y grid of Tiles or other objects"""
+    """
+    An x/y grid of single character cells, stored row by row in one flat bytearray rather than a dict of tuples.
+    Cells can be addressed either by an (i, j) tuple or by their flat index i * width + j, which is what the hot loops
+    of a search should use. If digits is set, each cell holds the integer value of its digit instead of its character
+    """
 
-    def __init__(self, raw_data: list[str]):
+    def __init__(self, raw_data: list[str], digits=False):
         self.height = len(raw_data)
         self.width = len(raw_data[0])
-        self.grid = {}
-        for i in range(self.height):
-            for j in range(self.width):
-                self.grid[i, j] = raw_data[i][j]
+        self.digits = digits
+        # The flat cells only line up with (i, j) positions if every row is the same length
+        for i, row in enumerate(raw_data):
+            if len(row) != self.width:
+                raise ValueError(
+                    f"Row {i} has {len(row)} cells, expected {self.width}: {row!r}"
+                )
+        self.cells = bytearray("".join(raw_data), "ascii")
+        if digits:
+            self.cells = self.cells.translate(DIGIT_TABLE)
+        # Flat index offsets for each neighbour, in the same Right, Down, Left, Up order as get_neighbours
+        self.offsets = (1, self.width, -1, -self.width)
+
+    def __len__(self) -> int:
+        return len(self.cells)
 
-    def inside_grid(self, pos: tuple[int, int]) -> bool:
+    def __getitem__(self, pos: tuple[int, int] or int) -> str or int:
+        if isinstance(pos, tuple):
+            pos = pos[0] * self.width + pos[1]
+        return self.cells[pos] if self.digits else chr(self.cells[pos])
+
+    def __setitem__(self, pos: tuple[int, int] or int, val: str or int):
+        if isinstance(pos, tuple):
+            pos = pos[0] * self.width + pos[1]
+        self.cells[pos] = val if self.digits else ord(val)
+
+    def index(self, pos: tuple[int, int]) -> int:
+        """Convert an (i, j) position to a flat index"""
+        return pos[0] * self.width + pos[1]
+
+    def position(self, index: int) -> tuple[int, int]:
+        """Convert a flat index back to an (i, j) position"""
+        return divmod(index, self.width)
+
+    def inside_grid(self, pos: tuple) -> bool:
+        """
+        Check whether a position lies inside the grid. The bitwise form also accepts a pair of NumPy arrays of row and
+        column indices, returning a boolean mask for all of them at once
+        """
         (i, j) = pos
-        return 0 <= i < self.height and 0 <= j < self.width
+        return (0 <= i) & (i < self.height) & (0 <= j) & (j < self.width)
 
     def get_neighbours(self, pos: tuple[int, int]) -> list[tuple[int, int]]:
         (i, j) = pos
@@ -94,13 +290,34 @@ class Grid(object):
         all_neighbours = [k for k in all_neighbours if self.inside_grid(k)]
         return all_neighbours
 
+    def get_neighbour_indices(self, index: int) -> list[int]:
+        """Flat index equivalent of get_neighbours, using the precomputed offsets"""
+        (right, down, left, up) = self.offsets
+        j = index % self.width
+        result = []
+        if j + 1 < self.width:
+            result.append(index + right)
+        if index + down < len(self.cells):
+            result.append(index + down)
+        if j > 0:
+            result.append(index + left)
+        if index + up >= 0:
+            result.append(index + up)
+        return result
+
+    def as_array(self):
+        """Return a zero-copy height x width NumPy view of the cells - requires NumPy to be installed"""
+        if numpy is None:
+            raise ImportError("NumPy is required for Grid.as_array()")
+        return numpy.frombuffer(self.cells, dtype=numpy.uint8).reshape(
+            self.height, self.width
+        )
+
     def print_grid(self, include_row_nums=False):
-        """Given a dictionary grid, print the contents line by line for debugging"""
+        """Print the contents line by line for debugging"""
         for i in range(0, self.height):
-            for j in range(0, self.width):
-                if include_row_nums and j == 0:
-                    print(f"{i}: ", end="")
-                if j == self.width - 1:
-                    print(self.grid[(i, j)])
-                else:
-                    print(self.grid[(i, j)], end="")
+            row = self.cells[i * self.width : (i + 1) * self.width]
+            row = "".join(str(k) for k in row) if self.digits else row.decode()
+            if include_row_nums:
+                row = f"{i}: {row}"
+            print(row)
@@ -11,14 +11,27 @@ treb7uchet
 ['1abc2', 'pqr3stu8vwx', 'a1b2c3d4e5f', 'treb7uchet']
 In this example, the calibration values of these four lines are 12, 38, 15, and 77. Adding these together produces 142.
 """
+import logging
+from typing import Iterable, Iterator
+
+from common_functions import stream_input
+
+log = logging.getLogger(__name__)
+
+# Only one line is needed at a time, so the aoc runner can hand over a stream of lines rather than a list
+STREAM_INPUT = True
 
 
 class TrebuchetCalibration(object):
-    def __init__(self):
-        with open("input.txt", "r") as f:
-            self.input_doc = f.readlines()
+    def __init__(self, filename="input.txt"):
+        self.filename = filename
+
+    @property
+    def input_doc(self) -> Iterator[str]:
+        """A fresh stream over the lines of the input file each time, as a stream can only be read once"""
+        return stream_input(self.filename)
 
-    def calculate_values(self, doc: list[str]) -> int:
+    def calculate_values(self, doc: Iterable[str]) -> int:
         sum = 0
         for line in doc:
             sum_string = ""
@@ -26,9 +39,18 @@ class TrebuchetCalibration(object):
             sum_string += numbers_only[0]
             sum_string += numbers_only[-1]
             sum += int(sum_string)
-        print(sum)
+        log.debug("Calibration total %s", sum)
+        return sum
+
+
+def parse_puzzle(raw_data: Iterable[str]) -> Iterable[str]:
+    return raw_data
+
+
+def solve_part_1(puzzle: Iterable[str]) -> int:
+    return TrebuchetCalibration().calculate_values(puzzle)
 
 
 if __name__ == "__main__":
     treb = TrebuchetCalibration()
-    treb.calculate_values(treb.input_doc)
+    print(treb.calculate_values(treb.input_doc))
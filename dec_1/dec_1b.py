@@ -15,12 +15,20 @@ zoneight234
 
 In this example, the calibration values are 29, 83, 13, 24, 42, 14, and 76. Adding these together produces 281.
 """
+import logging
+from typing import Iterable, Iterator
+
+from common_functions import stream_input
+
+log = logging.getLogger(__name__)
+
+# Only one line is needed at a time, so the aoc runner can hand over a stream of lines rather than a list
+STREAM_INPUT = True
 
 
 class TrebuchetCalibration(object):
-    def __init__(self):
-        with open("input.txt", "r") as f:
-            self.input_doc = f.readlines()
+    def __init__(self, filename="input.txt"):
+        self.filename = filename
         self.example = [
             "two1nine",
             "eightwothree",
@@ -71,13 +79,27 @@ class TrebuchetCalibration(object):
         line_list = [i for i in line_list if i is not None]
         return str(line_list[0] + line_list[-1])
 
-    def calculate_values(self, doc: list[str]):
+    @property
+    def input_doc(self) -> Iterator[str]:
+        """A fresh stream over the lines of the input file each time, as a stream can only be read once"""
+        return stream_input(self.filename)
+
+    def calculate_values(self, doc: Iterable[str]) -> int:
         sum = 0
         for line in doc:
             sum += int(self.process_line(line))
-        print(sum)
+        log.debug("Calibration total %s", sum)
+        return sum
+
+
+def parse_puzzle(raw_data: Iterable[str]) -> Iterable[str]:
+    return raw_data
+
+
+def solve_part_2(puzzle: Iterable[str]) -> int:
+    return TrebuchetCalibration().calculate_values(puzzle)
 
 
 if __name__ == "__main__":
     treb = TrebuchetCalibration()
-    treb.calculate_values(treb.example)
+    print(treb.calculate_values(treb.example))
@@ -105,135 +105,231 @@ Find the single giant loop starting at S. How many steps along the loop does it
 to the point farthest from the starting position?
 """
 
+import logging
+import sys
 from collections import namedtuple
+from itertools import combinations
+from typing import Iterator, TextIO
 
-from common_functions import load_input
+from common_functions import load_input, Grid, TRACE
 
-Pipe = namedtuple("Pipe", "valid_next_positions symbol")
-Point = namedtuple("Point", "x y")
-MapTile = namedtuple("MapTile", "pipe point")
+log = logging.getLogger(__name__)
+
+Pipe = namedtuple("Pipe", "connections symbol")
+Maze = namedtuple("Maze", "grid masks start")
+LoopMeasurement = namedtuple("LoopMeasurement", "length interior")
+
+# One bit per heading, in the same Right, Down, Left, Up order as Grid.offsets
+EAST, SOUTH, WEST, NORTH = 1, 2, 4, 8
+HEADINGS = (EAST, SOUTH, WEST, NORTH)
 
 # fmt: off
 VALID_PIPES = {
-    "|": Pipe(["north", "south"], "│"),  # is a vertical pipe connecting north and south.
-    "-": Pipe(["east", "west"], "─"),  # is a horizontal pipe connecting east and west.
-    "L": Pipe(["north", "east"], "└"),  # is a 90-degree bend connecting north and east.
-    "J": Pipe(["north", "west"], "┘"),  # is a 90-degree bend connecting north and west.
-    "7": Pipe(["south", "west"], "┐"),  # is a 90-degree bend connecting south and west.
-    "F": Pipe(["south", "east"], "┌"),  # is a 90-degree bend connecting south and east.
-    ".": Pipe([], " "),  # is ground; there is no pipe in this tile.
-    "S": Pipe(["north", "south", "east", "west"], "S"),  # is the starting position of the animal; there is a pipe on this tile
+    "|": Pipe(NORTH | SOUTH, "│"),  # is a vertical pipe connecting north and south.
+    "-": Pipe(EAST | WEST, "─"),  # is a horizontal pipe connecting east and west.
+    "L": Pipe(NORTH | EAST, "└"),  # is a 90-degree bend connecting north and east.
+    "J": Pipe(NORTH | WEST, "┘"),  # is a 90-degree bend connecting north and west.
+    "7": Pipe(SOUTH | WEST, "┐"),  # is a 90-degree bend connecting south and west.
+    "F": Pipe(SOUTH | EAST, "┌"),  # is a 90-degree bend connecting south and east.
+    ".": Pipe(0, " "),  # is ground; there is no pipe in this tile.
+    "S": Pipe(NORTH | SOUTH | EAST | WEST, "S"),  # is the starting position of the animal; there is a pipe on this tile
 }
 # fmt: on
 
-NEXT_MOVE = {
-    "north": Point(0, -1),
-    "east": Point(1, 0),
-    "south": Point(0, 1),
-    "west": Point(-1, 0),
-}
-
-DIRECTION_TRANSFORM = {
-    "north": "south",
-    "east": "west",
-    "south": "north",
-    "west": "east",
+# Box drawing symbols to draw each pipe with, indexed by the character's byte. Blanked tiles are zero bytes
+SYMBOLS = {ord(pipe): VALID_PIPES[pipe].symbol for pipe in VALID_PIPES} | {0: " "}
+# Translation table from a string of 0 and 1 bits to a byte mask
+LOOP_MASK = bytes.maketrans(b"01", b"\x00\xff")
+
+# Each pipe's connections indexed by the character's byte, so a whole grid translates to masks in one call
+CONNECTIONS = bytes(
+    VALID_PIPES[chr(i)].connections if chr(i) in VALID_PIPES else 0 for i in range(256)
+)
+# The headings straight back the way each mask of headings points, swapping east with west and south with north
+OPPOSITE = bytes((mask << 2 | mask >> 2) & 15 for mask in range(16))
+# Translation tables dropping one heading from every mask, to cut the connections leading off the grid
+WITHOUT = {
+    heading: bytes(mask & ~heading for mask in range(256)) for heading in HEADINGS
 }
-
-
-def parse_input_data(data: list[str]) -> (list[list[MapTile]], Point):
-    pipes = []
-    for y in range(len(data)):
-        row = []
-        for x in range(len(data[y])):
-            if data[y][x] == "S":
-                start_pos = Point(x, y)
-            elif data[y][x] == "\n":
-                continue
-            row.append(MapTile(VALID_PIPES[data[y][x]], Point(x, y)))
-        pipes.append(row)
-    return pipes, start_pos
-
-
-def check_next_position(
-    directions: list[str],
-    maze: list[list[MapTile]],
-    start: Point,
-) -> (list[str], list[Point]):
-    valid_directions = []
-    valid_points = []
-    for move in directions:
-        direction = DIRECTION_TRANSFORM[move]
-        check_tile = maze[start.y + NEXT_MOVE[move].y][start.x + NEXT_MOVE[move].x]
-        if direction in check_tile.pipe.valid_next_positions:
-            valid_directions.append(move)
-            valid_points.append(check_tile)
-    return valid_directions, valid_points
-
-
-def get_next_tiles(
-    maze: list[list[MapTile]], curr: MapTile, prev: MapTile
-) -> list[MapTile]:
-    moves = curr.pipe.valid_next_positions
-    next_x_a = curr.point.x + NEXT_MOVE[moves[0]].x
-    next_y_a = curr.point.y + NEXT_MOVE[moves[0]].y
-    next_tile_a = maze[next_y_a][next_x_a]
-    next_x_b = curr.point.x + NEXT_MOVE[moves[1]].x
-    next_y_b = curr.point.y + NEXT_MOVE[moves[1]].y
-    next_tile_b = maze[next_y_b][next_x_b]
-    if next_tile_b == prev:
-        return next_tile_a
-    else:
-        return next_tile_b
-
-
-def print_maze(current_pos: list[MapTile], maze: list[list[MapTile]], loop_only=False):
-    for row in maze:
-        for item in row:
-            symbol = item.pipe.symbol
-            if loop_only and item not in current_pos:
-                symbol = " "
-            elif not loop_only and item in current_pos:
-                symbol = "*"
-            if item is row[-1]:
-                symbol = symbol + "\n"
-            print(symbol, end="")
-    print()
+# Row and column change for a step in each heading, indexed by its bit
+ROW_STEPS = [0, 0, 1, 0, 0, 0, 0, 0, -1]
+COLUMN_STEPS = [0, 1, 0, 0, -1, 0, 0, 0, 0]
+
+
+def connection_masks(grid: Grid) -> bytearray:
+    """
+    Translate every tile into the mask of headings it connects, cutting any connection that leads off the edge of the
+    grid so a walk can never step outside it or wrap round onto the next row
+    """
+    (width, size) = (grid.width, len(grid))
+    masks = grid.cells.translate(CONNECTIONS)
+    masks[width - 1 :: width] = masks[width - 1 :: width].translate(WITHOUT[EAST])
+    masks[size - width :] = masks[size - width :].translate(WITHOUT[SOUTH])
+    masks[::width] = masks[::width].translate(WITHOUT[WEST])
+    masks[:width] = masks[:width].translate(WITHOUT[NORTH])
+    return masks
+
+
+def step_offsets(grid: Grid) -> list[int]:
+    """The flat index offset for a step in each heading, indexed by its bit"""
+    offsets = [0] * 9
+    for heading, offset in zip(HEADINGS, grid.offsets):
+        offsets[heading] = offset
+    return offsets
+
+
+def closes_loop(grid: Grid, masks: bytearray, start: int, shape: int) -> bool:
+    """Check whether leaving the start by the lowest heading of a shape follows the pipes back in by its other one"""
+    offsets = step_offsets(grid)
+    heading = shape & -shape
+    index = start
+    while True:
+        index += offsets[heading]
+        entry = OPPOSITE[heading]
+        if index == start:
+            return bool(shape & entry)
+        if not masks[index] & entry:
+            return False
+        heading = masks[index] ^ entry
+
+
+def infer_start_shape(grid: Grid, masks: bytearray, start: int) -> int:
+    """
+    Work out which pipe is hidden under the start tile from the neighbours that connect back to it. The start's mask
+    has already been cut at the edges of the grid, so only neighbours on the grid are ever looked at. Pipes off the loop
+    can point at the start too, so when more than two neighbours connect, the pair of headings whose walk comes back
+    round to the start is the one the loop uses
+    """
+    connected = [
+        heading
+        for heading, offset in zip(HEADINGS, grid.offsets)
+        if masks[start] & heading and masks[start + offset] & OPPOSITE[heading]
+    ]
+    if len(connected) == 2:
+        return connected[0] | connected[1]
+    for first, second in combinations(connected, 2):
+        if closes_loop(grid, masks, start, first | second):
+            return first | second
+    raise ValueError(
+        f"{len(connected)} pipes connect to the start at {grid.position(start)}, but no two of them close a loop"
+    )
+
+
+def trace_loop(maze: Maze) -> Iterator[tuple[int, int]]:
+    """Lazily walk the loop from the start, yielding each tile's flat index and the heading the loop leaves it by"""
+    (grid, masks, start) = maze
+    offsets = step_offsets(grid)
+    # Leave the start by the lowest of its two headings
+    heading = masks[start] & -masks[start]
+    index = start
+    while True:
+        yield index, heading
+        index += offsets[heading]
+        if index == start:
+            return
+        # Every pipe has two headings, so dropping the one it was entered by leaves the way out
+        entry = OPPOSITE[heading]
+        if not masks[index] & entry:
+            raise ValueError(f"The loop is broken at {grid.position(index)}")
+        heading = masks[index] ^ entry
+
+
+def measure_loop(maze: Maze) -> LoopMeasurement:
+    """
+    Walk the loop once, counting its tiles and the tiles it encloses without storing the loop.
+    Using the shoelace formula - https://en.wikipedia.org/wiki/Shoelace_formula
+    combined with Pick's theorem - https://en.wikipedia.org/wiki/Pick's_theorem
+    Pick's theorem: A = i + (b/2) - 1, where
+     - A = area = 1/2 ((X1Y2 - X2Y1) + ... + (XnYn+1 - Xn+1Yn))
+     - i = interior points - what we're solving for
+     - b = boundary points (e.g. number of loop tiles)
+    Therefore: i = A - (b/2) + 1
+    The loop only ever moves one tile across or down, so the shoelace sum reduces to 2A = 2 * sum(row * column step),
+    which needs no more than the current row to accumulate
+    """
+    row = maze.start // maze.grid.width
+    area = 0
+    length = 0
+    for _, heading in trace_loop(maze):
+        length += 1
+        area += row * COLUMN_STEPS[heading]
+        row += ROW_STEPS[heading]
+    # The loop is closed, so it always has an even number of tiles
+    interior = abs(area) - length // 2 + 1
+    log.debug("A:%s, b:%s, i:%s", abs(area), length, interior)
+    return LoopMeasurement(length, interior)
+
+
+def loop_bitset(maze: Maze) -> bytearray:
+    """Mark every tile on the loop in a bitset of flat indices, least significant bit first within each byte"""
+    bits = bytearray((len(maze.grid) + 7) // 8)
+    for index, _ in trace_loop(maze):
+        bits[index >> 3] |= 1 << (index & 7)
+    return bits
+
+
+def print_maze(
+    loop: bytearray,
+    grid: Grid,
+    loop_only=False,
+    viewport: tuple[int, int, int, int] = None,
+    stream: TextIO = None,
+):
+    """
+    Draw the maze with box drawing pipes, either blanking everything off the loop or starring everything on it. Each row
+    is built as a whole by masking its bytes against the loop bitset, and the frame goes out in a single write.
+    :param loop: the loop bitset from loop_bitset
+    :param grid: the maze
+    :param loop_only: if True, draw only the loop, otherwise draw the loop as stars over the rest of the maze
+    :param viewport: (top, left, bottom, right) to draw only that window of a large maze, ends exclusive
+    :param stream: where to write the frame, defaults to stdout
+    """
+    (top, left, bottom, right) = viewport or (0, 0, grid.height, grid.width)
+    (top, left) = (max(top, 0), max(left, 0))
+    (bottom, right) = (min(bottom, grid.height), min(right, grid.width))
+    columns = max(right - left, 0)
+    window = (1 << columns) - 1
+    stars = int.from_bytes(b"*" * columns, "big")
+    lines = []
+    for i in range(top, bottom):
+        first = i * grid.width + left
+        row = int.from_bytes(grid.cells[first : first + columns], "big")
+        # Spread the row's loop bits out to a 0xff byte for each tile on the loop, in the same order as the cells
+        on_loop = (
+            int.from_bytes(loop[first >> 3 : (first + columns >> 3) + 1], "little")
+            >> (first & 7)
+        ) & window
+        mask = int.from_bytes(
+            f"{on_loop:0{columns}b}"[::-1].encode().translate(LOOP_MASK), "big"
+        )
+        row = row & mask if loop_only else row & ~mask | stars & mask
+        lines.append(row.to_bytes(columns, "big").decode().translate(SYMBOLS))
+    (stream or sys.stdout).write("\n".join(lines) + "\n\n")
+
+
+def parse_puzzle(raw_data: list[str]) -> Maze:
+    grid = Grid([row for row in raw_data if row])
+    masks = connection_masks(grid)
+    start = grid.cells.index(b"S")
+    masks[start] = infer_start_shape(grid, masks, start)
+    return Maze(grid, masks, start)
+
+
+def solve_part_1(maze: Maze) -> int:
+    return measure_loop(maze).length // 2
+
+
+def solve_part_2(maze: Maze) -> int:
+    return measure_loop(maze).interior
 
 
 if __name__ == "__main__":
     data = load_input("example.txt")
-    maze, start = parse_input_data(data)
-    start = MapTile(VALID_PIPES["S"], start)
-    print(f"Start: {start}")
-    moves, tiles = check_next_position(NEXT_MOVE.keys(), maze, start.point)
-    print(f"Starting moves: {moves}, starting tiles: {tiles}")
-    move = moves[0]
-    tile = tiles[0]
-    current_tile = tile
-    maze_tiles = [start]
-    while current_tile != start:
-        prev = maze_tiles[-1]
-        maze_tiles.append(current_tile)
-        current_tile = get_next_tiles(maze, current_tile, prev)
-    print_maze(maze_tiles, maze, loop_only=True)
-    print(len(maze_tiles) // 2)
+    maze = parse_puzzle(data)
+    log.debug("Start: %s", maze.grid.position(maze.start))
+    if TRACE:
+        print_maze(loop_bitset(maze), maze.grid, loop_only=True)
+    measurement = measure_loop(maze)
+    print(measurement.length // 2)
     # Part 2
-    points = [i.point for i in maze_tiles]
-    area = 0
-    # Using the shoelace formula - https://en.wikipedia.org/wiki/Shoelace_formula
-    # combined with Pick's theorem - https://en.wikipedia.org/wiki/Pick's_theorem
-    # Pick's theorem: A = i + (b/2) - 1, where
-    #  - A = area = 1/2 ((X1Y2 - X2Y1) + ... + (XnYn+1 - Xn+1Yn))
-    #  - i = interior points - what we're solving for
-    #  - b = boundary points (e.g. number of loop tiles)
-    # Therefore: i = A - (b/2) + 1
-    boundary_points = len(points)
-    for i in range(0, boundary_points - 1):
-        area_n = (points[i].x * points[i + 1].y) - (points[i + 1].x * points[i].y)
-        area += area_n
-    # For the final point in the matrix, we must consider Xn,Yn and X0,Y0 to complete the boundary
-    area += (points[-1].x * points[0].y) - (points[0].x * points[-1].y)
-    area = abs(area / 2)
-    internal = area - (boundary_points / 2) + 1
-    print(f"A:{area}, b:{boundary_points}, i:{internal}")
+    print(measurement.interior)
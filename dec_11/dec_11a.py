@@ -98,100 +98,96 @@ Expand the universe, then find the length of the shortest path between every pai
 lengths?
 """
 
+import logging
 from collections import namedtuple
+from itertools import accumulate
+from typing import Iterable
 
 from common_functions import load_input
 
-Point = namedtuple("Point", "x y")
-
-
-def get_empty_row_cols(raw_data: list[str]) -> tuple[list[int], list[int]]:
-    empty_rows = [i for i in range(len(raw_data)) if "#" not in raw_data[i]]
-    transposed_data = [
-        [raw_data[j][i] for j in range(len(raw_data))] for i in range(len(raw_data[0]))
-    ]
-    empty_cols = [
-        i for i in range(0, len(transposed_data)) if "#" not in transposed_data[i]
-    ]
-    return empty_rows, empty_cols
-
-
-def enumerate_galaxies(input_data: list[list[str]]) -> tuple[dict, int]:
-    counter = 0
-    galaxy_dict = {}
-    for i in range(len(input_data)):
-        for j in range(len(input_data[i])):
-            if input_data[i][j] == "#":
-                counter += 1
-                galaxy_dict[counter] = Point(j, i)
-    return galaxy_dict, counter
-
-
-def enumerate_galaxies_with_expansion(
-    input_data: list[list[str]], empty_rows: list[int], empty_cols: list[int], offset=1
-) -> tuple[dict, int]:
-    galaxy_counter = 0
-    empty_x = 0
-    empty_y = 0
-    galaxy_dict = {}
-    for i in range(len(input_data)):
-        if i in empty_rows:
-            empty_y += offset
-        for j in range(len(input_data[i])):
-            if j in empty_cols:
-                empty_x += offset
-            if input_data[i][j] == "#":
-                galaxy_counter += 1
-                galaxy_dict[galaxy_counter] = Point(j + empty_x, i + empty_y)
-        empty_x = 0
-    return galaxy_dict, galaxy_counter
-
-
-def calculate_distance(galaxy_map: dict, start: int, end: int) -> int:
-    dx = abs(galaxy_map[start].x - galaxy_map[end].x)
-    dy = abs(galaxy_map[start].y - galaxy_map[end].y)
-    return dx + dy
-
-
-def get_galactic_distances(galaxy_map: dict, start: int):
-    distances = []
-    for i in range(1, start + 1):
-        for j in range(i, start + 1):
-            if i == j:
-                continue
-            distances.append(calculate_distance(galaxy_map, i, j))
-    print(sum(distances))
+log = logging.getLogger(__name__)
+
+# The total distance between every pair of galaxies is base + offset * growth, where offset is how many extra rows or
+# columns each empty one expands by
+GalaxyDistances = namedtuple("GalaxyDistances", "base growth")
+
+
+def locate_galaxies(raw_data: list[str]) -> tuple[list[int], list[int]]:
+    """Find the row and column of every galaxy, scanning each row with str.find rather than cell by cell"""
+    rows = []
+    columns = []
+    for i, row in enumerate(raw_data):
+        j = row.find("#")
+        while j != -1:
+            rows.append(i)
+            columns.append(j)
+            j = row.find("#", j + 1)
+    return rows, columns
+
+
+def count_empty_before(occupied: list[int]) -> list[int]:
+    """Prefix counts of the rows or columns without a galaxy - entry k is how many come before k"""
+    empty = bytearray(b"\x01") * (max(occupied, default=-1) + 1)
+    for k in occupied:
+        empty[k] = 0
+    return list(accumulate(empty, initial=0))
+
+
+def sum_pairwise_gaps(values: Iterable[int]) -> int:
+    """
+    Total the gap between every pair of values in O(n log n) without forming the pairs. Once the values are sorted,
+    each one is the larger of the pairs it makes with all the values before it, so it contributes its value times
+    their count less their running total
+    """
+    total = 0
+    running = 0
+    for count, value in enumerate(sorted(values)):
+        total += count * value - running
+        running += value
+    return total
+
+
+def measure_galaxies(raw_data: list[str]) -> GalaxyDistances:
+    """
+    Total the distances between every pair of galaxies as a linear function of the expansion. The gaps between galaxies
+    in the unexpanded image give the base, and the gaps between their counts of empty rows and columns before them give
+    how much that grows for each extra row or column an empty one expands by
+    """
+    rows, columns = locate_galaxies(raw_data)
+    empty_rows = count_empty_before(rows)
+    empty_columns = count_empty_before(columns)
+    base = sum_pairwise_gaps(rows) + sum_pairwise_gaps(columns)
+    growth = sum_pairwise_gaps(empty_rows[i] for i in rows)
+    growth += sum_pairwise_gaps(empty_columns[j] for j in columns)
+    log.debug("%s galaxies, base %s, growth %s", len(rows), base, growth)
+    return GalaxyDistances(base, growth)
+
+
+def expanded_distance(distances: GalaxyDistances, offset: int) -> int:
+    return distances.base + offset * distances.growth
+
+
+def parse_puzzle(raw_data: list[str]) -> GalaxyDistances:
+    return measure_galaxies(raw_data)
+
+
+def solve_part_1(distances: GalaxyDistances) -> int:
+    return expanded_distance(distances, 1)
+
+
+def solve_part_2(distances: GalaxyDistances) -> int:
+    # Each empty row or column is replaced by a million, so it gains 999999 extra
+    return expanded_distance(distances, 999999)
 
 
 if __name__ == "__main__":
     filename = "example.txt"
     data = load_input(filename)
-
-    null_rows, null_cols = get_empty_row_cols(data)
-    print(f"empty rows {null_rows}, empty_cols {null_cols}")
-    universe, galaxy_count = enumerate_galaxies_with_expansion(
-        data, null_rows, null_cols
-    )
-    get_galactic_distances(universe, galaxy_count)
+    distances = parse_puzzle(data)
+    print(solve_part_1(distances))
 
     # Part two
     print("PART 2!")
-    # Recalculate original galaxy positions to set up offset calcs
-    test_universe, test_galaxy_count = enumerate_galaxies_with_expansion(
-        data, null_rows, null_cols
-    )
-    get_galactic_distances(test_universe, test_galaxy_count)  # Prints 374 for example
-    test_universe, test_galaxy_count = enumerate_galaxies_with_expansion(
-        data, null_rows, null_cols, offset=9
-    )
-    get_galactic_distances(test_universe, test_galaxy_count)  # Prints 1030 for example
-    test_universe, test_galaxy_count = enumerate_galaxies_with_expansion(
-        data, null_rows, null_cols, offset=99
-    )
-    get_galactic_distances(test_universe, test_galaxy_count)  # Prints 8410 for example
-    test_universe, test_galaxy_count = enumerate_galaxies_with_expansion(
-        data, null_rows, null_cols, offset=999999
-    )
-    get_galactic_distances(
-        test_universe, test_galaxy_count
-    )  # Prints 82000210 for example
+    # Prints 374, 1030, 8410 and 82000210 for example
+    for offset in [1, 9, 99, 999999]:
+        print(expanded_distance(distances, offset))
@@ -72,9 +72,12 @@ For each row, count all of the different arrangements of operational and broken
 What is the sum of those counts?
 """
 
+import logging
 from collections import namedtuple
 
-from common_functions import load_input
+from common_functions import load_input, TRACE
+
+log = logging.getLogger(__name__)
 
 SpringGroup = namedtuple("SpringGroup", "condition_log broken_groups")
 
@@ -84,40 +87,78 @@ def parse_group(group: str) -> SpringGroup:
     return SpringGroup(group[0], tuple(int(i) for i in group[1].split(",")))
 
 
-def check_group(conditions: str, group: tuple[int]) -> int:
-    """Given a set of conditions and a list of groupings associated with that group,"""
-    print(f"Springs {conditions} groups: {group} ", end="")
-    char = conditions[0]
-    broken_count = group[0]
-    print(f"sping: {char} broken: {broken_count}")
-    result = 0
+def unfold(row: SpringGroup, factor: int) -> SpringGroup:
+    """Repeat the conditions a number of times joined by ?, along with the same number of copies of the groups"""
+    return SpringGroup(
+        "?".join([row.condition_log] * factor), row.broken_groups * factor
+    )
+
+
+def count_arrangements(conditions: str, groups: tuple[int]) -> int:
+    """
+    Count the ways the groups of broken springs can be laid over a row of conditions. Works back from the last group,
+    where ways[i] is the number of arrangements of the groups placed so far within conditions[i:], so the whole row is
+    a single pass per group
+    """
+    length = len(conditions)
+    # operational_before[i] is the number of . in conditions[:i], so any stretch can be checked for a . in one step
+    operational_before = [0]
+    for char in conditions:
+        operational_before.append(operational_before[-1] + (char == "."))
+
+    # With no groups left to place, the rest of the row can't hold any more broken springs. The extra entry at the end
+    # is where a group finishing on the last spring continues from
+    ways = [0] * (length + 2)
+    ways[length] = ways[length + 1] = 1
+    for i in range(length - 1, -1, -1):
+        ways[i] = ways[i + 1] if conditions[i] != "#" else 0
+
+    for size in reversed(groups):
+        next_ways = ways
+        ways = [0] * (length + 2)
+        for i in range(length - size, -1, -1):
+            char = conditions[i]
+            # Either this spring is operational and the group starts later on...
+            count = ways[i + 1] if char != "#" else 0
+            # ...or the group starts here, covering no operational springs and followed by one that isn't broken
+            stop = i + size
+            if (
+                char != "."
+                and operational_before[stop] == operational_before[i]
+                and (stop == length or conditions[stop] != "#")
+            ):
+                count += next_ways[stop + 1]
+            ways[i] = count
+    return ways[0]
+
+
+def count_all_arrangements(springs: list[SpringGroup], unfold_factor=1) -> int:
+    output = 0
+    for row in springs:
+        if unfold_factor != 1:
+            row = unfold(row, unfold_factor)
+        count = count_arrangements(row.condition_log, row.broken_groups)
+        if TRACE:
+            log.debug("%s %s - %s arrangements", *row, count)
+        output += count
+    return output
+
 
-    def check_stop():
-        """If . we can move immediately on since this doesn't count toward our tally"""
-        return check_group(conditions[1:], group)
+def parse_puzzle(raw_data: list[str]) -> list[SpringGroup]:
+    return [parse_group(row) for row in raw_data]
 
-    def check_hash():
-        return 1
 
-    def check_question():
-        return check_stop() + check_hash()
+def solve_part_1(springs: list[SpringGroup]) -> int:
+    return count_all_arrangements(springs)
 
-    if char == ".":
-        result = check_stop()
-    elif char == "#":
-        result = check_hash()
-    elif char == "?":
-        result = check_question()
 
-    return result
+def solve_part_2(springs: list[SpringGroup]) -> int:
+    return count_all_arrangements(springs, unfold_factor=5)
 
 
 if __name__ == "__main__":
     data = load_input("example.txt")
-    springs = [parse_group(row) for row in data]
-    print(springs)
-    output = 0
-    for row in springs:
-        output += check_group(row.condition_log, row.broken_groups)
-    print(output)
-    pass
+    springs = parse_puzzle(data)
+    log.debug("Springs %s", springs)
+    print(solve_part_1(springs))
+    print(solve_part_2(springs))
@@ -65,20 +65,16 @@ of 405.
 Find the line of reflection in each of the patterns in your notes. What number do you get after summarizing all of your
 notes?
 """
-from pprint import pprint
+import logging
 
-from common_functions import load_input, parse_data_on_empty_rows
+from common_functions import (
+    load_input,
+    parse_data_on_empty_rows,
+    transpose_data,
+    TRACE,
+)
 
-
-def transpose_data(row_based_data: list[str]) -> list[str]:
-    """Given a grid of strings, return the same grid transformed into columns instead of rows"""
-    result = []
-    for i in range(len(row_based_data[0])):
-        temp_list = []
-        for j in range(len(row_based_data)):
-            temp_list.append(row_based_data[j][i])
-        result.append("".join(temp_list))
-    return result
+log = logging.getLogger(__name__)
 
 
 def find_mirrored_rows(puzzle: list[str]) -> int:
@@ -144,30 +140,39 @@ def print_mirror_with_reflection_line(
     print("".join(print_str))
 
 
-if __name__ == "__main__":
-    # Reddit example should be 709 for p1 and 1400 for p2
-    data = load_input("example.txt")
-    puzzles = parse_data_on_empty_rows(data)
-    print(f"{len(puzzles)} total puzzles")
-    puzzles = [(item, transpose_data(item)) for item in puzzles]
+def summarise_mirrors(
+    puzzles: list[tuple[list[str], list[str]]], find_rows=find_mirrored_rows
+) -> int:
+    """Add up the columns left of each vertical mirror line and 100 times the rows above each horizontal one"""
     mirror_sum = 0
-    for item in puzzles:
-        print(f"{puzzles.index(item)}:")
-        assert transpose_data(item[0]) == item[1]
-        assert item[0] == transpose_data(item[1])
-        h_row = find_mirrored_rows(item[0])
-        v_col = find_mirrored_rows(item[1])
-        print(f"Vertical col index: {v_col}")
-        print(f"Horizontal row index: {h_row}")
+    for index, item in enumerate(puzzles):
+        h_row = find_rows(item[0])
+        v_col = find_rows(item[1])
+        if TRACE:
+            log.debug("%s: vertical col %s, horizontal row %s", index, v_col, h_row)
         if v_col > h_row:
             mirror_sum += v_col
-            print_mirror_with_reflection_line(item[1], v_col, transpose=True)
+            if TRACE:
+                print_mirror_with_reflection_line(item[1], v_col, transpose=True)
         else:
             mirror_sum += 100 * h_row
-            print_mirror_with_reflection_line(item[0], h_row)
-        print(f"Sum {mirror_sum}")
-    # Part 2!
-    print("--------- Part 2 ---------")
+            if TRACE:
+                print_mirror_with_reflection_line(item[0], h_row)
+    return mirror_sum
+
+
+def parse_puzzle(raw_data: list[str]) -> list[tuple[list[str], list[str]]]:
+    puzzles = parse_data_on_empty_rows(raw_data.copy())
+    # The mirror searches read the same columns over and over, and patterns are small, so build each column once. A lazy
+    # column view, even one caching its columns, pays for a Python level lookup on every read and runs slower here
+    return [(item, transpose_data(item)) for item in puzzles]
+
+
+def solve_part_1(puzzles: list[tuple[list[str], list[str]]]) -> int:
+    return summarise_mirrors(puzzles)
+
+
+def solve_part_2(puzzles: list[tuple[list[str], list[str]]]) -> int:
     # We need to find the rows where only one character is different and see how this changes the mirror line.
     # We aren't looking for the location of the mirror row itself, we are looking for places where we can adjust
     # a single character and create a new mirror line elsewhere.
@@ -176,19 +181,18 @@ if __name__ == "__main__":
     # If two rows match, aside from one character, we can then use the same mirror check as before
     # The brute for approach would be to check each row against it's neighbour,
     # tallying differences and continuing if the tally == 1
-    mirror_sum = 0
+    return summarise_mirrors(puzzles, find_smudged_rows)
+
+
+if __name__ == "__main__":
+    # Reddit example should be 709 for p1 and 1400 for p2
+    data = load_input("example.txt")
+    puzzles = parse_puzzle(data)
+    log.debug("%s total puzzles", len(puzzles))
     for item in puzzles:
-        print(f"{puzzles.index(item)}:")
         assert transpose_data(item[0]) == item[1]
         assert item[0] == transpose_data(item[1])
-        h_row = find_smudged_rows(item[0])
-        v_col = find_smudged_rows(item[1])
-        print(f"Vertical col index: {v_col}")
-        print(f"Horizontal row index: {h_row}")
-        if v_col > h_row:
-            mirror_sum += v_col
-            print_mirror_with_reflection_line(item[1], v_col, transpose=True)
-        else:
-            mirror_sum += 100 * h_row
-            print_mirror_with_reflection_line(item[0], h_row)
-        print(f"Sum {mirror_sum}")
+    print(solve_part_1(puzzles))
+    # Part 2!
+    print("--------- Part 2 ---------")
+    print(solve_part_2(puzzles))
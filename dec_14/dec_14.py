@@ -51,101 +51,176 @@ The total load is the sum of the load caused by all of the rounded rocks. In thi
 Tilt the platform so that the rounded rocks all roll north. Afterward, what is the total load on the north support
 beams?
 """
-from pprint import pprint
-
-from common_functions import load_input, transpose_data
-
-
-def move_rocks_as_strings(puzzle: list[str]) -> list[str]:
-    # Assuming initially we are always only moving things north
-    # Assuming also that puzzle is unmodified
-    updated_puzzle = puzzle.copy()
-    return_puzzle = []
-    for i in range(len(updated_puzzle)):
-        # Find fixed rocks to be reinserted later
-        fixed_rocks = [
-            j for j in range(len(updated_puzzle[i])) if updated_puzzle[i][j] == "#"
-        ]
-        # Remove the fixed rocks so we can collapse the mobile rocks within a row
-        new_rows = updated_puzzle[i].split("#")
-        updated_row = ""
-        for row in new_rows:
-            rock_count = row.count("O")
-            updated_row = (
-                updated_row + "O" * rock_count + ("." * (len(row) - rock_count))
+import logging
+from collections import namedtuple
+
+from common_functions import load_input, TRACE, find_cycle
+
+log = logging.getLogger(__name__)
+
+
+# The north load and the equivalent load towards the east travel with the rocks, so reading the load is free and the two
+# together make a cheap fingerprint of the state
+PlatformState = namedtuple("PlatformState", "rounded north_load east_load")
+
+
+class Platform(object):
+    """
+    The platform as bitboards, with the rounded and cube rocks each held in a single integer. Cell (i, j) is bit
+    i * stride + j, where the stride leaves a spare bit at the end of every row that is never free, so rocks can't roll
+    from one row into the next. Tilting only shifts and masks whole boards, with no transposing or strings - north and
+    south are a shift by the stride and east and west a shift by one
+    """
+
+    def __init__(self, rows: list[str]):
+        self.height = len(rows)
+        self.width = len(rows[0])
+        self.stride = self.width + 1
+        self.cubes = self.to_bits(rows, "#")
+        self.inside = self.to_bits(rows, "")
+        # Bit k of each plane is set for the cells whose weight has bit k set. Rows weigh more towards the north and
+        # columns more towards the east
+        self.north_planes = []
+        for k in range(self.height.bit_length()):
+            self.north_planes.append(
+                int(
+                    "".join(
+                        "0" + ("1" if (self.height - i) >> k & 1 else "0") * self.width
+                        for i in reversed(range(self.height))
+                    ),
+                    2,
+                )
             )
-        # Reinserted the fixed rocks
-        for rock in fixed_rocks:
-            updated_row = updated_row[:rock] + "#" + updated_row[rock:]
-        return_puzzle.append(updated_row)
-    return return_puzzle
-
-
-def calculate_weight(puzzle: list[str]) -> int:
-    total_weight = 0
-    for i in range(len(puzzle)):
-        rocks = puzzle[i].count("O")
-        row_weight = rocks * (len(puzzle) - i)
-        total_weight += row_weight
-    return total_weight
-
-
-def cycle_rocks(puzzle: list[str]) -> list[str]:
-    # Rotate north:
-    north_puzzle = move_rocks_as_strings(transpose_data(puzzle))
-    north_puzzle = transpose_data(north_puzzle)
-    # print("North")
-    # pprint(north_puzzle)
-
-    west_puzzle = move_rocks_as_strings(north_puzzle)
-    # print("West")
-    # pprint(west_puzzle)
-
-    west_puzzle.reverse()
-    south_puzzle = transpose_data(west_puzzle)
-    south_puzzle = move_rocks_as_strings(south_puzzle)
-    south_puzzle = transpose_data(south_puzzle)
-    south_puzzle.reverse()
-    # print("South")
-    # pprint(south_puzzle)
-
-    east_puzzle = transpose_data(south_puzzle)
-    east_puzzle.reverse()
-    east_puzzle = transpose_data(east_puzzle)
-    east_puzzle = move_rocks_as_strings(east_puzzle)
-    east_puzzle = transpose_data(east_puzzle)
-    east_puzzle.reverse()
-    east_puzzle = transpose_data(east_puzzle)
-    # print("East")
-    # pprint(east_puzzle)
-    return east_puzzle
+        self.east_planes = []
+        for k in range(self.width.bit_length()):
+            row = "".join(
+                "1" if (j + 1) >> k & 1 else "0" for j in reversed(range(self.width))
+            )
+            self.east_planes.append(int(("0" + row) * self.height, 2))
+        rounded = self.to_bits(rows, "O")
+        self.start = PlatformState(
+            rounded,
+            self.measure_load(rounded, self.north_planes),
+            self.measure_load(rounded, self.east_planes),
+        )
+
+    def to_bits(self, rows: list[str], char: str) -> int:
+        """Set the bit for every cell holding a given character, or for every cell if no character is given"""
+        table = {ord(c): "0" for c in "O#."}
+        if char:
+            table[ord(char)] = "1"
+        else:
+            table = dict.fromkeys(table, "1")
+        # int() wants the most significant bit first, which is the end of the last row
+        return int(
+            "".join("0" + row[::-1].translate(table) for row in reversed(rows)), 2
+        )
+
+    def to_rows(self, rounded: int) -> list[str]:
+        bits = f"{rounded:0{self.height * self.stride}b}"
+        cubes = f"{self.cubes:0{self.height * self.stride}b}"
+        rows = []
+        for i in range(self.height):
+            start = (self.height - i - 1) * self.stride + 1
+            rows.append(
+                "".join(
+                    "O" if bit == "1" else "#" if cube == "1" else "."
+                    for bit, cube in zip(
+                        bits[start : start + self.width],
+                        cubes[start : start + self.width],
+                    )
+                )[::-1]
+            )
+        return rows
+
+    @staticmethod
+    def measure_load(rounded: int, planes: list[int]) -> int:
+        """Weigh every rock at once, one bit of the weights at a time"""
+        return sum((rounded & plane).bit_count() << k for k, plane in enumerate(planes))
+
+    def roll_back(self, rounded: int, shift: int) -> int:
+        """Roll every rock towards the lower bits one cell at a time, all at once, until none of them can move"""
+        while True:
+            free = self.inside ^ self.cubes ^ rounded
+            moving = rounded & (free << shift)
+            if not moving:
+                return rounded
+            rounded ^= moving | (moving >> shift)
+
+    def roll_forward(self, rounded: int, shift: int) -> int:
+        """Roll every rock towards the higher bits until none of them can move"""
+        while True:
+            free = self.inside ^ self.cubes ^ rounded
+            moving = rounded & (free >> shift)
+            if not moving:
+                return rounded
+            rounded ^= moving | (moving << shift)
+
+    # Tilting north or south only changes the north load, and east or west only the east load
+    def tilt_north(self, state: PlatformState) -> PlatformState:
+        rounded = self.roll_back(state.rounded, self.stride)
+        return state._replace(
+            rounded=rounded, north_load=self.measure_load(rounded, self.north_planes)
+        )
+
+    def tilt_west(self, state: PlatformState) -> PlatformState:
+        rounded = self.roll_back(state.rounded, 1)
+        return state._replace(
+            rounded=rounded, east_load=self.measure_load(rounded, self.east_planes)
+        )
+
+    def tilt_south(self, state: PlatformState) -> PlatformState:
+        rounded = self.roll_forward(state.rounded, self.stride)
+        return state._replace(
+            rounded=rounded, north_load=self.measure_load(rounded, self.north_planes)
+        )
+
+    def tilt_east(self, state: PlatformState) -> PlatformState:
+        rounded = self.roll_forward(state.rounded, 1)
+        return state._replace(
+            rounded=rounded, east_load=self.measure_load(rounded, self.east_planes)
+        )
+
+    def spin_cycle(self, state: PlatformState) -> PlatformState:
+        # The loads after the first two tilts are overwritten by the last two, so only weigh the rocks at the end
+        rounded = self.roll_back(self.roll_back(state.rounded, self.stride), 1)
+        rounded = self.roll_forward(self.roll_forward(rounded, self.stride), 1)
+        return PlatformState(
+            rounded,
+            self.measure_load(rounded, self.north_planes),
+            self.measure_load(rounded, self.east_planes),
+        )
+
+    @staticmethod
+    def fingerprint(state: PlatformState) -> (int, int):
+        return state.north_load, state.east_load
+
+
+def parse_puzzle(raw_data: list[str]) -> list[str]:
+    return raw_data
+
+
+def solve_part_1(puzzle: list[str]) -> int:
+    # Rocks can only be moved as far as the first hash they encounter
+    platform = Platform(puzzle)
+    return platform.tilt_north(platform.start).north_load
+
+
+def solve_part_2(puzzle: list[str], cycles=1_000_000_000) -> int:
+    # The platform settles into a loop of states after a while, so find it and skip straight to the last cycle
+    platform = Platform(puzzle)
+    prefix, period, state = find_cycle(
+        platform.start, platform.spin_cycle, cycles, key=platform.fingerprint
+    )
+    log.debug("Cycle of %s states after %s spin cycles", period, prefix)
+    if TRACE:
+        log.debug("Final platform %s", platform.to_rows(state.rounded))
+    return state.north_load
 
 
 if __name__ == "__main__":
     data = load_input("example.txt")
-    # We need a function to parse the data into columns then move all the rocks.
-    # Rocks can only be moved as far as the first hash they encounter
-    print(data)
-    moved_rocks = move_rocks_as_strings(transpose_data(data))
-    print(f"Part 1 weight {calculate_weight(transpose_data(moved_rocks))}")
+    log.debug("Platform %s", data)
+    print(f"Part 1 weight {solve_part_1(data)}")
     # Part 2
-    # We need to figure out what transformations are required for the data to complete a cycle
-    # Then we need to work out some sort of simplification so we can do a billion cycles in a reasonable timeframe
-    # Naive solution: just run the cycles a billion times
-
-    counter = 999
-    rocks = data.copy()
-    weights = []
-    while counter >= 0:
-        # TODO: Calculate actual repeating cycle and work out properly
-        rocks = cycle_rocks(rocks)
-        updated_weight = calculate_weight(rocks)
-        if counter % 10000 == 0:
-            print(
-                f"Iteration {counter} - {len(weights)} weights - {weights} - weight: {updated_weight}"
-            )
-        if updated_weight not in weights:
-            print(f"Cycle repeated - {counter} - {updated_weight}")
-            weights.append(updated_weight)
-        counter -= 1
-    print(calculate_weight(rocks))
+    print(solve_part_2(data))
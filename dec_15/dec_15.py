@@ -64,9 +64,12 @@ Run the HASH algorithm on each step in the initialization sequence. What is the
 sequence is one long line; be careful when copy-pasting it.)
 """
 
+import logging
 from re import search
 
-from common_functions import load_input
+from common_functions import load_input, TRACE
+
+log = logging.getLogger(__name__)
 
 
 def hash_string(unhashed: str) -> int:
@@ -100,19 +103,22 @@ def iterate_on_sequence(unhashed: list[str]) -> dict:
         label = search("[a-zA-Z]+", item).group()
         action = search("[^a-zA-Z0-9]", item).group()
         index = hash_string(label)
-        print(f"{label} - {item} - {action}")
+        if TRACE:
+            log.debug("%s - %s - %s", label, item, action)
         if action == "-":
             labels[index] = remove_lens(label, labels[index])
         else:
             labels[index] = add_lens(label, item, labels[index])
-    print(labels)
+    if TRACE:
+        log.debug("Boxes %s", labels)
     return labels
 
 
 def remove_lens(key: str, box: list[str]) -> list[str]:
     for i in range(0, len(box)):
         if key in box[i]:
-            print(f"Matched: {key} - {i} - {box[i]}")
+            if TRACE:
+                log.debug("Matched: %s - %s - %s", key, i, box[i])
             box.pop(i)
             break
     return box
@@ -129,24 +135,34 @@ def add_lens(label: str, value: str, box: list[str]) -> list[str]:
     return box
 
 
-def calculate_focus_power(boxes: dict):
+def calculate_focus_power(boxes: dict) -> int:
     total = 0
     for box in boxes:
         for i in range(len(boxes[box])):
             value = search("\d+", boxes[box][i]).group()
             total += (box + 1) * (i + 1) * int(value)
-    print(total)
+    log.debug("Focus power %s", total)
+    return total
+
+
+def parse_puzzle(raw_data: list[str]) -> list[str]:
+    return parse_data(raw_data)
+
+
+def solve_part_1(sequence: list[str]) -> int:
+    return tally_hashed_list(sequence)
+
+
+def solve_part_2(sequence: list[str]) -> int:
+    return calculate_focus_power(iterate_on_sequence(sequence))
 
 
 if __name__ == "__main__":
     data = load_input("example.txt")
-    print(data)
-    data = parse_data(data)
-    print(data)
-    sequence_sum = tally_hashed_list(data)
-    print(sequence_sum)
+    data = parse_puzzle(data)
+    log.debug("Sequence %s", data)
+    print(solve_part_1(data))
 
     # Part 2
     print("Part 2:")
-    steps = iterate_on_sequence(data)
-    calculate_focus_power(steps)
+    print(solve_part_2(data))
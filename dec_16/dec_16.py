@@ -104,15 +104,38 @@ Find the initial beam configuration that energizes the largest number of tiles;
 configuration?
 """
 
-from collections import namedtuple, deque
-
-from common_functions import load_input, transform_data_to_dict_grid, print_grid
+import logging
+from array import array
+from collections import namedtuple, defaultdict
+from itertools import chain
+from multiprocessing import Pool
+from typing import Iterable, Iterator, Optional
+
+from common_functions import (
+    load_input,
+    Grid,
+    TRACE,
+    WORKERS,
+    strongly_connected_components,
+)
+
+log = logging.getLogger(__name__)
 
 Beam = namedtuple("Beam", "pos dir")
-Tile = namedtuple("Tile", "type energised direction")
+# The per-grid tables from beam_steps that drive a beam one tile at a time
+BeamTables = namedtuple("BeamTables", "codes steps runs")
+# A set of flat indices as a byte per tile of the grid, 1 for each tile in the set, along with how many there are
+DenseTiles = namedtuple("DenseTiles", "flags count")
+# The tiles energised from a component of the beam graph, as a dense set shared between components (or None) plus a
+# set of tiles not in it
+Reach = namedtuple("Reach", "base extras")
 
 DIRECTIONS = {"right": (0, 1), "down": (1, 0), "left": (0, -1), "up": (-1, 0)}
 DIRECTION_SYMBOLS = {(0, 1): ">", (1, 0): "V", (0, -1): "<", (-1, 0): "^"}
+# Directions by number, in the same Right, Down, Left, Up order as Grid.offsets
+HEADINGS = list(DIRECTIONS.values())
+# The directions a splitter sends a beam out in when the beam hits it side on
+SPLITTERS = {ord("-"): (0, 2), ord("|"): (1, 3)}
 
 
 def rotate_tuple_clockwise(pos: tuple[int, int]) -> tuple[int, int]:
@@ -125,21 +148,14 @@ def rotate_tuple_anticlockwise(pos: tuple[int, int]) -> tuple[int, int]:
     return pos[1] * -1, pos[0]
 
 
-def print_energised_grid(grid: dict, pos: tuple[int, int]):
-    grid_to_print = {i: grid[i].type for i in grid}
-    grid_to_print[pos] = "*"
-    print_grid(grid_to_print)
-
-
-def print_final_grid(grid: dict):
-    grid_to_print = {i: grid[i].direction for i in grid}
-    print_grid(grid_to_print)
+def print_energised_grid(grid: Grid, pos: tuple[int, int]):
+    print_final_grid(grid, {pos: "*"})
 
 
-def compute_next_position(
-    position: tuple[int, int], direction: tuple[int, int]
-) -> tuple[int, int]:
-    return position[0] + direction[0], position[1] + direction[1]
+def print_final_grid(grid: Grid, energised: dict):
+    """Print the grid with the direction a beam last travelled through each energised tile"""
+    for i in range(grid.height):
+        print("".join(energised.get((i, j), grid[i, j]) for j in range(grid.width)))
 
 
 def compute_next_direction(
@@ -184,41 +200,396 @@ def compute_next_direction(
     return []
 
 
-def breadth_first_search(grid: dict, beam: Beam) -> dict:
-    queue = deque()
-    goal = 0
-    # Label root node as explored
-    grid[beam.pos] = Tile(grid[beam.pos].type, True, DIRECTION_SYMBOLS[beam.dir])
-    queue.append(beam)
-    splitters = []
-    while len(queue) > 0:
-        goal += 1
-        v = queue.pop()
-        if goal >= len(grid) * 2:
-            print(f"Probable infinite loop - iteration {goal}")
-            return grid
-        next_directions = compute_next_direction(grid[v.pos].type, v.dir)
-        # No need to check splitters that have already been checked from a given direction
-        # e.g. We can tell we have reached a loop in the map if the beam is already in the splitter list
-        if len(next_directions) > 1:
-            if v not in splitters:
-                splitters.append(v)
-            else:
+# Every tile kind, numbered in this order, and the directions by number a beam leaves each kind of tile in for each
+# direction it arrives in - worked out once here rather than on every step of a beam
+TILE_KINDS = ".-|/\\"
+TILE_CODES = bytes(
+    TILE_KINDS.index(chr(i)) * 16 if chr(i) in TILE_KINDS else 0 for i in range(256)
+)
+TRANSITIONS = [
+    tuple(
+        HEADINGS.index(next_direction)
+        for next_direction in compute_next_direction(tile, heading)
+    )
+    for tile in TILE_KINDS
+    for heading in HEADINGS
+]
+# What a straight run of beam does on reaching each tile, indexed by code * 4 + direction like the steps table -
+# carry on, turn off a mirror, where it has to watch for going round a loop, or stop at a splitter hit side on
+(PASS, TURN, SPLIT) = (0, 1, 2)
+BEAM_ACTIONS = bytes(
+    SPLIT
+    if len(TRANSITIONS[code >> 4 << 2 | direction]) > 1
+    else TURN
+    if TILE_KINDS[code >> 4] in "/\\"
+    else PASS
+    for code in range(len(TILE_KINDS) * 16)
+    for direction in range(4)
+)
+
+
+def beam_steps(grid: Grid) -> BeamTables:
+    """
+    Precompute everything a beam needs to take a step, so following one is a single table lookup per tile. Each tile
+    gets a code of its kind * 16 plus a bitmask of the directions that would take a beam off the grid from there. The
+    steps table, indexed by code * 4 + direction, holds what to add to a packed beam of flat index * 4 + direction to
+    get each beam that carries on from it. The runs table holds the single step for a beam that simply carries on
+    through a tile, or 0 wherever it turns off a mirror, splits or would leave the grid
+    """
+    width = grid.width
+    codes = grid.cells.translate(TILE_CODES)
+    for index in range(0, len(codes), width):
+        codes[index] |= 1 << 2
+        codes[index + width - 1] |= 1 << 0
+    for index in range(width):
+        codes[index] |= 1 << 3
+        codes[len(codes) - width + index] |= 1 << 1
+
+    steps = []
+    for code in range(len(TILE_KINDS) * 16):
+        (kind, edges) = divmod(code, 16)
+        for direction in range(4):
+            steps.append(
+                tuple(
+                    grid.offsets[next_direction] * 4 + next_direction - direction
+                    for next_direction in TRANSITIONS[kind * 4 + direction]
+                    if not edges >> next_direction & 1
+                )
+            )
+    runs = [
+        step[0] if action == PASS and step else 0
+        for step, action in zip(steps, BEAM_ACTIONS)
+    ]
+    return BeamTables(codes, steps, runs)
+
+
+def breadth_first_search(
+    grid: Grid, beam: Beam, tables: BeamTables = None
+) -> bytearray:
+    """
+    Follow a beam through the grid, returning a bitmask for every tile of the directions beams have entered it in, so
+    a tile is energised if its mask isn't zero. A beam entering a tile in a direction already seen there can only
+    retrace known steps, which catches every loop exactly, and each of the four directions of each tile is followed at
+    most once. Beams waiting to be followed are packed into ints of flat index * 4 + direction. Pass in the tables from
+    beam_steps to reuse them across searches of the same grid
+    """
+    (codes, steps, _) = tables or beam_steps(grid)
+    visited = bytearray(len(grid))
+    queue = [grid.index(beam.pos) * 4 + HEADINGS.index(beam.dir)]
+    while queue:
+        beam = queue.pop()
+        index = beam >> 2
+        direction = beam & 3
+        if visited[index] >> direction & 1:
+            continue
+        visited[index] |= 1 << direction
+        for step in steps[codes[index] << 2 | direction]:
+            queue.append(beam + step)
+    return visited
+
+
+def count_energised(visited: bytearray) -> int:
+    return len(visited) - visited.count(0)
+
+
+def energised_symbols(grid: Grid, visited: bytearray) -> dict:
+    """
+    The symbols to draw over the energised tiles - an arrow where one beam went through an empty tile, the number of
+    beams where several did, and the tile itself for mirrors and splitters
+    """
+    symbols = {}
+    for index, directions in enumerate(visited):
+        if not directions:
+            continue
+        pos = grid.position(index)
+        if grid[index] != ".":
+            symbols[pos] = grid[index]
+        elif directions.bit_count() > 1:
+            symbols[pos] = str(directions.bit_count())
+        else:
+            symbols[pos] = DIRECTION_SYMBOLS[HEADINGS[directions.bit_length() - 1]]
+    return symbols
+
+
+def trace_beam(tables: BeamTables, beam: int) -> (array, Optional[int]):
+    """
+    Follow a beam, packed as flat index * 4 + direction, until it leaves the grid or hits a splitter side on, bouncing
+    off any mirrors along the way. Driven by the same tables as breadth_first_search, from beam_steps. Returns the tiles
+    it passes through as flat indices and the splitter it ends at, if any
+    """
+    (codes, steps, runs) = tables
+    tiles = array("i")
+    append = tiles.append
+    turns = set()
+    while True:
+        index = beam >> 2
+        append(index)
+        key = codes[index] << 2 | beam & 3
+        step = runs[key]
+        if step:
+            beam += step
+            continue
+        action = BEAM_ACTIONS[key]
+        if action == SPLIT:
+            return tiles, index
+        if action == TURN:
+            # A beam leaving a splitter end on can go round a loop of mirrors back through the same splitter
+            if beam in turns:
+                return tiles, None
+            turns.add(beam)
+        # Anything but a splitter hit side on has one way out, unless that would leave the grid
+        if not steps[key]:
+            return tiles, None
+        beam += steps[key][0]
+
+
+def trace_splitters(grid: Grid, tables: BeamTables, splitters: list[int]) -> list:
+    """Trace the beams each splitter sends out when hit side on, skipping any that would leave the grid at once"""
+    return [
+        [
+            trace_beam(tables, (index + grid.offsets[direction]) * 4 + direction)
+            for direction in SPLITTERS[grid.cells[index]]
+            if not tables.codes[index] >> direction & 1
+        ]
+        for index in splitters
+    ]
+
+
+# The grid and its beam tables in each pool worker, handed over once by init_worker
+worker_grid = None
+
+
+def init_worker(grid: Grid, tables: BeamTables):
+    global worker_grid
+    worker_grid = (grid, tables)
+
+
+def trace_splitters_in_worker(splitters: list[int]) -> (array, list):
+    """
+    Trace a shard of splitters in a pool worker. Pickling an array per beam costs over half as much as tracing it, so
+    the tiles of every beam go back in one array, with the length and end of each beam to cut it up again by
+    """
+    tiles = array("i")
+    shapes = []
+    for segments in trace_splitters(*worker_grid, splitters):
+        for segment, _ in segments:
+            tiles.extend(segment)
+        shapes.append([(len(segment), end) for segment, end in segments])
+    return tiles, shapes
+
+
+def unpack_traces(shards: Iterable[tuple[array, list]]) -> Iterator[list]:
+    """Cut the tiles sent back by trace_splitters_in_worker into a zero-copy view for each beam"""
+    for tiles, shapes in shards:
+        view = memoryview(tiles)
+        start = 0
+        for shape in shapes:
+            segments = []
+            for length, end in shape:
+                segments.append((view[start : start + length], end))
+                start += length
+            yield segments
+
+
+class BeamGraph(object):
+    """
+    The grid boiled down to the straight runs a beam takes between splitters, so the beams from every edge share the
+    work of following them. A splitter hit side on always sends beams out both ways whichever side it was hit from, so
+    each splitter is a node leading to the splitters at the ends of its two beams. Nodes that lead round to each other
+    form strongly connected components which energise exactly the same tiles, so those tiles are worked out once per
+    component and shared by every beam that ends up there
+    """
+
+    def __init__(self, grid: Grid, workers: int = 1):
+        """
+        Tracing every splitter's beams is most of the work of building the graph, so with more than one worker the
+        splitters are traced in shards across a pool of processes. The grid and tables go to each worker once through
+        the pool initializer - inherited where processes are forked, pickled once per worker otherwise - and only the
+        splitter indices and the traced beams travel with the tasks
+        """
+        self.grid = grid
+        self.tables = beam_steps(grid)
+        splitters = [
+            index for index, tile in enumerate(grid.cells) if tile in SPLITTERS
+        ]
+        # Each splitter's outgoing beams, as the flat indices of the tiles they pass through and where they end
+        if workers > 1:
+            # A few shards per worker evens out splitters whose beams run further than others
+            shard = -(-len(splitters) // (workers * 4)) or 1
+            shards = [splitters[i : i + shard] for i in range(0, len(splitters), shard)]
+            with Pool(
+                workers, initializer=init_worker, initargs=(grid, self.tables)
+            ) as pool:
+                traced = unpack_traces(pool.imap(trace_splitters_in_worker, shards))
+                self.nodes = dict(zip(splitters, traced))
+        else:
+            self.nodes = dict(
+                zip(splitters, trace_splitters(grid, self.tables, splitters))
+            )
+        successors = {
+            index: [end for _, end in segments if end is not None]
+            for index, segments in self.nodes.items()
+        }
+        self.components = strongly_connected_components(successors)
+        self.component_of = {
+            index: k
+            for k, component in enumerate(self.components)
+            for index in component
+        }
+        if TRACE:
+            log.debug(
+                "%s splitters in %s components", len(self.nodes), len(self.components)
+            )
+
+    def dense_tiles(
+        self, tile_groups: Iterable[Iterable[int]], bases: Iterable[DenseTiles] = ()
+    ) -> DenseTiles:
+        """Mark every tile in a number of groups of tiles, along with every tile of any dense sets already built"""
+        flags = bytearray(len(self.grid))
+        for tiles in tile_groups:
+            for index in tiles:
+                flags[index] = 1
+        if bases:
+            # Every flag is 0 or 1, so OR-ing the bytes as one big int merges the sets
+            merged = int.from_bytes(flags, "little")
+            for base in bases:
+                merged |= int.from_bytes(base.flags, "little")
+            flags = merged.to_bytes(len(flags), "little")
+        return DenseTiles(flags, len(flags) - flags.count(0))
+
+    def tile_count(self, k: int) -> int:
+        """How many tiles a component's splitters and beams cover, counting repeats"""
+        return len(self.components[k]) + sum(
+            len(segment)
+            for index in self.components[k]
+            for segment, _ in self.nodes[index]
+        )
+
+    def component_tiles(self, k: int) -> Iterable[int]:
+        """The splitters in a component and the tiles their beams pass through, which may include repeats"""
+        component = self.components[k]
+        return chain(
+            component,
+            *(segment for index in component for segment, _ in self.nodes[index]),
+        )
+
+    def reach(self, ends: Iterable[int]) -> dict:
+        """
+        Work out the tiles energised from the components of each of the given splitters, returning a Reach for each of
+        those components. Only the components they lead on to are visited, in reverse topological order so everything
+        a component leads to is always ready. Most components sit in front of a few large ones, so each Reach is a
+        dense set shared with the components it leads to plus a small set of its own extra tiles. A component's extras
+        are taken over rather than copied by the last component still to come that needs them, so a chain of splitters
+        into a large component grows one set. A component only goes dense when its own tiles or its extras outgrow the
+        size limit, or when it leads to more than one dense set
+        """
+        wanted = {self.component_of[end] for end in ends}
+        successors = {}
+        stack = list(wanted)
+        while stack:
+            k = stack.pop()
+            if k in successors:
                 continue
-        for direction in next_directions:
-            next_pos = compute_next_position(v.pos, direction)
-            if next_pos not in grid.keys():
-                print(f"Next position doesnt exist -{next_pos}")
+            leads_to = {
+                self.component_of[end]
+                for index in self.components[k]
+                for _, end in self.nodes[index]
+                if end is not None
+            }
+            leads_to.discard(k)
+            successors[k] = leads_to
+            stack.extend(leads_to)
+        dependents = defaultdict(int)
+        for leads_to in successors.values():
+            for successor in leads_to:
+                dependents[successor] += 1
+
+        # Past this many tiles a set costs more to copy and check than a dense set costs to build
+        limit = max(64, len(self.grid) >> 8)
+        reach = {}
+        # Components are numbered in reverse topological order, so anything a component leads to comes before it
+        for k in sorted(successors):
+            sources = []
+            donors = []
+            for successor in successors[k]:
+                sources.append(reach[successor])
+                dependents[successor] -= 1
+                if not dependents[successor] and successor not in wanted:
+                    donors.append(reach.pop(successor))
+            bases = {id(source.base): source.base for source in sources}
+            bases.pop(id(None), None)
+
+            if len(bases) > 1 or self.tile_count(k) > limit:
+                dense = self.dense_tiles(
+                    [self.component_tiles(k), *(source.extras for source in sources)],
+                    list(bases.values()),
+                )
+                reach[k] = Reach(dense, set())
                 continue
-            # Label tiles that have been explored
-            new_dir = (
-                DIRECTION_SYMBOLS[direction]
-                if grid[next_pos].type not in ["/", "\\", "-", "|"]
-                else grid[next_pos].type
+
+            base = next(iter(bases.values()), None)
+            shared = [source for source in donors if source.base is base]
+            extras = (
+                max(shared, key=lambda r: len(r.extras)).extras if shared else set()
+            )
+            new_tiles = [self.component_tiles(k)]
+            for source in sources:
+                if source.extras is extras:
+                    continue
+                if source.base is base:
+                    extras |= source.extras
+                else:
+                    new_tiles.append(source.extras)
+            if base is None:
+                extras.update(*new_tiles)
+            else:
+                flags = base.flags
+                extras.update(index for index in chain(*new_tiles) if not flags[index])
+            if len(extras) > limit:
+                base = self.dense_tiles([extras], [base] if base else [])
+                extras = set()
+            reach[k] = Reach(base, extras)
+
+        if TRACE:
+            log.debug(
+                "%s of %s components reached, %s dense sets",
+                len(successors),
+                len(self.components),
+                len({id(r.base) for r in reach.values() if r.base is not None}),
+            )
+        return reach
+
+    @staticmethod
+    def count_with_reach(reach: Reach, tiles: Iterable[int]) -> int:
+        """Count the tiles energised by a beam that passes through the given tiles and then on to a Reach"""
+        extra = set(tiles)
+        extra.difference_update(reach.extras)
+        count = len(reach.extras)
+        if reach.base is not None:
+            flags = reach.base.flags
+            extra = [index for index in extra if not flags[index]]
+            count += reach.base.count
+        return count + len(extra)
+
+    def energised_counts(self, beams: list[Beam]) -> list[int]:
+        """
+        Count the tiles energised by each of a number of beams entering the grid. Each beam is traced to the first
+        splitter it hits side on, and the tiles it passed through on the way are checked against that splitter's
+        component
+        """
+        traces = [
+            trace_beam(
+                self.tables, self.grid.index(beam.pos) * 4 + HEADINGS.index(beam.dir)
             )
-            grid[next_pos] = Tile(grid[next_pos].type, True, new_dir)
-            queue.append(Beam(next_pos, direction))
-    return grid
+            for beam in beams
+        ]
+        reach = self.reach(end for _, end in traces if end is not None)
+        return [
+            len(set(tiles))
+            if end is None
+            else self.count_with_reach(reach[self.component_of[end]], tiles)
+            for tiles, end in traces
+        ]
 
 
 def generate_starting_positions(row_max: int, col_max: int) -> list[tuple]:
@@ -236,41 +607,39 @@ def generate_starting_positions(row_max: int, col_max: int) -> list[tuple]:
     # 8                 9
     # 9 1 2 3 4 5 6 7 8 9
     start_bottom = [((0, i), "down") for i in range(col_max)]
-    start_top = [((col_max - 1, i), "up") for i in range(col_max)]
+    start_top = [((row_max - 1, i), "up") for i in range(col_max)]
     start_right = [((i, 0), "right") for i in range(row_max)]
-    start_left = [((i, row_max - 1), "left") for i in range(row_max)]
+    start_left = [((i, col_max - 1), "left") for i in range(row_max)]
 
     return start_left + start_right + start_top + start_bottom
 
 
+def parse_puzzle(raw_data: list[str]) -> Grid:
+    return Grid(raw_data)
+
+
+def solve_part_1(grid: Grid) -> int:
+    return count_energised(
+        breadth_first_search(grid, Beam((0, 0), DIRECTIONS["right"]))
+    )
+
+
+def solve_part_2(grid: Grid, workers: int = WORKERS) -> int:
+    positions = generate_starting_positions(grid.height, grid.width)
+    beams = [Beam(pos, DIRECTIONS[direction]) for pos, direction in positions]
+    # Every edge is evaluated in one pass over the beam graph, sharing the tiles behind each splitter
+    return max(BeamGraph(grid, workers).energised_counts(beams))
+
+
 if __name__ == "__main__":
     data = load_input("example.txt")
-    grid = transform_data_to_dict_grid(data)
-    print_grid(grid)
+    grid = parse_puzzle(data)
+    grid.print_grid()
     beam = Beam((0, 0), (0, 1))
-    grid = {i: Tile(grid[i], False, grid[i]) for i in grid}
-    print_grid(grid)
-    print(grid)
-    update_grid = breadth_first_search(grid, beam)
-    print_final_grid(update_grid)
-    tally = [1 for i in update_grid if update_grid[i].energised]
-    print(sum(tally))
+    visited = breadth_first_search(grid, beam)
+    print_final_grid(grid, energised_symbols(grid, visited))
+    print(count_energised(visited))
 
     # Part 2
     print("\nPart 2!\n")
-    vals = []
-    positions = generate_starting_positions(len(data), len(data[0]))
-    # Brute force approach - try every possible combination
-    for opt in positions:
-        grid = transform_data_to_dict_grid(data)
-        grid = {i: Tile(grid[i], False, grid[i]) for i in grid}
-        beam = Beam(opt[0], DIRECTIONS[opt[1]])
-        print_grid(grid)
-        print(grid)
-        update_grid = breadth_first_search(grid, beam)
-        print_final_grid(update_grid)
-        tally = [1 for i in update_grid if update_grid[i].energised]
-        print(sum(tally))
-        vals.append(sum(tally))
-    print(vals)
-    print(max(vals))
+    print(solve_part_2(grid))
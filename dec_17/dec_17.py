@@ -54,23 +54,30 @@ Directing the crucible from the lava pool to the machine parts factory, but not
 blocks in the same direction, what is the least heat loss it can incur?
 """
 
-from collections import namedtuple, deque
-from typing import Optional
+import logging
+from array import array
+from heapq import heappop, heappush
 
 from common_functions import load_input, Grid, print_grid
 
+log = logging.getLogger(__name__)
+
 # Block = namedtuple("Block", "pos val visited prior_direction steps_since_turn")
 DIRECTIONS = {"right": (0, 1), "down": (1, 0), "left": (0, -1), "up": (-1, 0)}
 ARROWS = {"right": "→", "down": "↓", "left": "←", "up": "↑"}
+# The same Right, Down, Left, Up order as Grid.get_neighbours, so turning left or right is one step either way round
+HEADINGS = list(DIRECTIONS)
+MOVES = list(DIRECTIONS.values())
 
 
-def get_direction(previous: tuple[int, int], current: tuple[int, int]) -> str:
-    i = current[0] - previous[0]
-    j = current[1] - previous[1]
-    return list(DIRECTIONS.keys())[list(DIRECTIONS.values()).index((i, j))]
+# Heat loss of a state that hasn't been reached yet - anything real is far smaller
+UNREACHED = 2**31 - 1
 
 
 class Block(object):
+    # Only built for the blocks along the final path, but slots keep each one small and quick to create
+    __slots__ = ("pos", "val", "prior_dir", "sslt", "heat_loss")
+
     def __init__(
         self,
         pos: tuple[int, int],
@@ -88,78 +95,141 @@ class Block(object):
     def __repr__(self):
         return f"Block({self.pos}, {self.val}, {self.prior_dir}, {self.sslt}, {self.heat_loss})"
 
-    def get_neighbours(self):
-        (i, j) = self.pos
-        return [
-            (i + DIRECTIONS["right"][0], j + DIRECTIONS["right"][1]),
-            (i + DIRECTIONS["down"][0], j + DIRECTIONS["down"][1]),
-            (i + DIRECTIONS["left"][0], j + DIRECTIONS["left"][1]),
-            (i + DIRECTIONS["up"][0], j + DIRECTIONS["up"][1]),
-        ]
+
+def encode_state(index: int, direction: int, run: int, max_run: int) -> int:
+    """Pack a flat grid index, a direction and a run length into a single int"""
+    return (index * 4 + direction) * (max_run + 1) + run
+
+
+def decode_state(state: int, max_run: int) -> (int, int, int):
+    rest, run = divmod(state, max_run + 1)
+    index, direction = divmod(rest, 4)
+    return index, direction, run
 
 
 def dijkstra(
-    graph: Grid, source: tuple[int, int], destination: tuple[int, int]
-) -> (dict, dict):
-    block_queue = deque()
-    total_loss: dict[tuple[int, int], Block] = {}
-    prev: dict[tuple[int, int], Optional[tuple[int, int]]] = {}
-    total_loss[source] = Block(source, graph.grid[source], "right", 0, 0)
-    prev[source] = None
-    block_queue.append(source)
-    travel_count = 0
-
-    while len(block_queue) != 0:
-        current = block_queue.popleft()
-        if current == destination:
+    graph: Grid,
+    source: tuple[int, int],
+    destination: tuple[int, int],
+    min_run=1,
+    max_run=3,
+    a_star=False,
+) -> (int, list[Block]):
+    """
+    Find the least heat loss from source to destination for a crucible that has to move at least min_run and at most
+    max_run blocks in a straight line before it turns, and can never reverse. A node is a (position, direction, run)
+    state rather than just a position, since where the crucible can go next depends on how it got there.
+
+    States are packed into ints with encode_state, so the heat losses and predecessors are flat arrays indexed by state
+    rather than dicts, and each queue entry is a single int of priority * state count + state.
+    :param a_star: order the queue by heat loss plus the Manhattan distance to the destination, priced at the cheapest
+    block, which never overestimates and so still finds the least heat loss
+    :return: the least heat loss and the blocks along the path that incurs it
+    """
+    cells = graph.cells
+    width = graph.width
+    offsets = graph.offsets
+    runs = max_run + 1
+    state_count = len(cells) * 4 * runs
+    # Heat losses fit in 32 bits, but the number of states grows with the grid so predecessors get a full word
+    total_loss = array("i", [UNREACHED]) * state_count
+    prev = array("l", [-1]) * state_count
+    lowest = min(cells) if a_star else 0
+    (goal_i, goal_j) = destination
+    goal = graph.index(destination)
+
+    # The moves open to a crucible heading in each direction after each run length, looked up rather than worked out
+    # for every state taken off the queue
+    next_moves = []
+    for direction in range(4):
+        for run in range(runs):
+            moves = []
+            if run < max_run:
+                moves.append((direction, run + 1))
+            if run >= min_run:
+                moves.append(((direction + 1) % 4, 1))
+                moves.append(((direction - 1) % 4, 1))
+            next_moves.append(moves)
+
+    # The crucible starts off without having moved, so it can head right or down
+    block_queue = []
+    start_estimate = lowest * (abs(goal_i - source[0]) + abs(goal_j - source[1]))
+    for direction in (HEADINGS.index("right"), HEADINGS.index("down")):
+        state = encode_state(graph.index(source), direction, 0, max_run)
+        total_loss[state] = 0
+        heappush(block_queue, start_estimate * state_count + state)
+
+    while block_queue:
+        priority, state = divmod(heappop(block_queue), state_count)
+        rest, run = divmod(state, runs)
+        index, direction = divmod(rest, 4)
+        (i, j) = divmod(index, width)
+        heat_loss = total_loss[state]
+        if priority > heat_loss + lowest * (abs(goal_i - i) + abs(goal_j - j)):
+            # A cheaper way to this state was found after this entry was queued
+            continue
+        if index == goal and run >= min_run:
             break
-        for next_block in graph.get_neighbours(current):
-            block = Block(
-                next_block,
-                graph.grid[next_block],
-                get_direction(current, next_block),
-                travel_count,
-                0,
-            )
-            # Calculate the cost of this step, ignoring turn requirements
-            block.heat_loss = total_loss[current].heat_loss + block.val
-            # We only want new blocks or blocks where the cost is less on a subsequent visit
-            if (
-                next_block not in prev.keys()
-                or block.heat_loss < total_loss[next_block].heat_loss
-            ):
-                total_loss[next_block] = block
-                block_queue.append(next_block)
-                prev[next_block] = current
-
-        travel_count += 1
-
-    return total_loss, prev
-    # Maybe useful? https://stackabuse.com/courses/graphs-in-python-theory-and-implementation/lessons/dijkstras-algorithm/
+
+        # How far the crucible can go to the Right, Down, Left and Up before leaving the grid
+        room = (width - 1 - j, graph.height - 1 - i, j, i)
+        for next_direction, next_run in next_moves[direction * runs + run]:
+            if not room[next_direction]:
+                continue
+            next_index = index + offsets[next_direction]
+            next_loss = heat_loss + cells[next_index]
+            next_state = (next_index * 4 + next_direction) * runs + next_run
+            if next_loss < total_loss[next_state]:
+                total_loss[next_state] = next_loss
+                prev[next_state] = state
+                if lowest:
+                    (di, dj) = MOVES[next_direction]
+                    next_loss += lowest * (abs(goal_i - i - di) + abs(goal_j - j - dj))
+                heappush(block_queue, next_loss * state_count + next_state)
+    else:
+        raise ValueError(f"No route from {source} to {destination}")
+
+    path = []
+    while state != -1:
+        (index, direction, run) = decode_state(state, max_run)
+        pos = graph.position(index)
+        path.append(
+            Block(pos, cells[index], HEADINGS[direction], run, total_loss[state])
+        )
+        state = prev[state]
+    return heat_loss, path[::-1]
+
+
+def parse_puzzle(raw_data: list[str]) -> Grid:
+    return Grid(raw_data, digits=True)
+
+
+def solve_part_1(grid: Grid) -> int:
+    goal = (grid.height - 1, grid.width - 1)
+    heat_loss, _ = dijkstra(grid, (0, 0), goal)
+    return heat_loss
+
+
+def solve_part_2(grid: Grid) -> int:
+    """The ultra crucible has to go at least 4 blocks before turning or stopping, and at most 10"""
+    goal = (grid.height - 1, grid.width - 1)
+    heat_loss, _ = dijkstra(grid, (0, 0), goal, min_run=4, max_run=10)
+    return heat_loss
 
 
 if __name__ == "__main__":
     data = load_input("example.txt")
-    grid = Grid(data)
+    grid = parse_puzzle(data)
     grid.print_grid()
-    # Cast all values to int
-    for item in grid.grid:
-        grid.grid[item] = int(grid.grid[item])
-    print(grid.grid)
-    # This looks like a breadth first search problem? Or a candidate for A*
-    # We know our starting position, and we know our goal
     start = (0, 0)
     goal = (len(data) - 1, len(data[0]) - 1)
-    print(f"Start pos {start}:{grid.grid[start]}, goal {goal}:{grid.grid[goal]}")
-    # We cannot move more than 3 steps in a single direction, and we can only turn left or right
-    # Within those 3 steps, we want the sum of the temperature values to be as low as possible
-    # So we likely need a function to sum a path
-    # We want to find the route with the lowest "cost" to visit - something to search for
-    # This could be a use case for Dijkstra's algorithm? -https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm
-    # How do we incorporate the turn requirement into the algorithm? We can treat the heat loss as part of the distance
-    # calculation but how does required turning fit?
-    # Does this suggest that A* is the more appropriate approach since we can include a heuristic to determine the
-    # weight of each move? - https://en.wikipedia.org/wiki/A*_search_algorithm
-    dist, steps = dijkstra(grid, start, goal)
-    new_grid = {step: ARROWS[dist[step].prior_dir] for step in dist}
-    print_grid(new_grid)
+    log.debug("Start pos %s:%s, goal %s:%s", start, grid[start], goal, grid[goal])
+    # We cannot move more than 3 steps in a single direction, and we can only turn left or right. Where the crucible
+    # can go next depends on its direction and how far it has come in a straight line, so those are part of each node
+    # in the search along with its position, and the heat loss is the distance
+    heat_loss, path = dijkstra(grid, start, goal, a_star=True)
+    print(heat_loss)
+    route = {(i, j): grid[i, j] for i in range(grid.height) for j in range(grid.width)}
+    route.update((block.pos, ARROWS[block.prior_dir]) for block in path[1:])
+    print_grid(route)
+    print(solve_part_2(grid))
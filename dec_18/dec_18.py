@@ -90,101 +90,138 @@ Convert the hexadecimal color codes into the correct instructions; if the Elves
 cubic meters of lava could the lagoon hold?
 """
 
-from common_functions import load_input, print_grid
+import logging
+import mmap
+import os
+import re
+from array import array
+from collections import namedtuple
+from itertools import chain
+from typing import Iterable, Iterator
+
+log = logging.getLogger(__name__)
+
+# Steps for each direction in the order the hex codes number them - R, D, L, U
+COMPASS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+# Translation table turning both the direction letters and the hex direction digits into indices into COMPASS
+DIRECTION_CODES = bytes.maketrans(b"RDLU0123", bytes([0, 1, 2, 3] * 2))
+# One whole instruction and the end of its line, so consecutive matches have to cover the plan with nothing between them
+DIG_PLAN_PATTERN = re.compile(
+    rb"([RDLU]) (\d+) \(#([0-9a-fA-F]{5})([0-3])\)[ \t\r]*(?:\n|\Z)"
+)
+
+# Both readings of the dig plan - the direction of each channel as an index into COMPASS, and its length in metres
+DigPlan = namedtuple("DigPlan", "directions metres hex_directions hex_metres")
+
+
+def invalid_line(data: bytes, position: int) -> ValueError:
+    """The error for a line of the plan that isn't a dig instruction, naming the line and its number"""
+    end = data.find(b"\n", position)
+    line = bytes(data[position : len(data) if end == -1 else end])
+    number = bytes(data[:position]).count(b"\n") + 1
+    return ValueError(
+        f"Invalid dig instruction on line {number}: {line.decode(errors='replace')!r}"
+    )
+
+
+def parse_dig_plan(data: bytes) -> DigPlan:
+    """
+    Decode a whole dig plan in a single pass over its bytes, reading the plain and the hex encoded instructions at the
+    same time straight into compact arrays, without building an object per channel. Raises a ValueError naming the
+    first line that isn't a dig instruction
+    """
+    plan = DigPlan(bytearray(), array("q"), bytearray(), array("q"))
+    position = 0
+    for match in DIG_PLAN_PATTERN.finditer(data):
+        if match.start() != position:
+            raise invalid_line(data, position)
+        position = match.end()
+        (direction, metres, hex_metres, hex_direction) = match.groups()
+        plan.directions.extend(direction)
+        plan.metres.append(int(metres))
+        plan.hex_directions.extend(hex_direction)
+        plan.hex_metres.append(int(hex_metres, 16))
+    if data[position:].strip():
+        raise invalid_line(data, position)
+    # Turn the letters and digits into indices into COMPASS in place, once they've all been read
+    plan.directions[:] = plan.directions.translate(DIRECTION_CODES)
+    plan.hex_directions[:] = plan.hex_directions.translate(DIRECTION_CODES)
+    return plan
+
+
+def load_dig_plan(filename: str) -> DigPlan:
+    """Decode a dig plan straight from a memory map of the file"""
+    with open(filename, "rb") as f:
+        # A file with nothing in it can't be mapped, but is still a valid (empty) plan
+        if not os.fstat(f.fileno()).st_size:
+            return parse_dig_plan(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return parse_dig_plan(mapped)
+
+
+def trace_vertices(directions: bytearray, metres: array) -> Iterator[tuple[int, int]]:
+    """Lazily yield the corner at the end of each channel in turn, starting from the origin"""
+    i = j = 0
+    for direction, distance in zip(directions, metres):
+        (di, dj) = COMPASS[direction]
+        i += di * distance
+        j += dj * distance
+        yield i, j
 
-COMPASS = {"R": (0, 1), "D": (1, 0), "L": (0, -1), "U": (-1, 0)}
-HEX_DIREX = {0: "R", 1: "D", 2: "L", 3: "U"}
 
+def calculate_area(vertices: Iterable[tuple[int, int]]) -> int:
+    """
+    Count the cubic metres dug out, trench included, from the corners of the trench in order - only one corner is held
+    at a time and everything stays in integers however long the channels are.
+    Using the shoelace formula - https://en.wikipedia.org/wiki/Shoelace_formula
+    combined with Pick's theorem - https://en.wikipedia.org/wiki/Pick's_theorem
+    Pick's theorem: A = i + (b/2) - 1, where
+     - A = area = 1/2 ((X1Y2 - X2Y1) + ... + (XnYn+1 - Xn+1Yn))
+     - i = interior points
+     - b = boundary points, one for every metre of trench
+    The lagoon holds i + b = A + (b/2) + 1 cubic metres, and 2A + b is always even so it can be halved exactly. A plan
+    with no trench digs nothing, rather than the one cubic metre the formula would give
+    """
+    twice_area = 0
+    boundary = 0
+    (i, j) = (0, 0)
+    # The trench starts at the origin, and coming back to it at the end closes the loop
+    for next_i, next_j in chain(vertices, [(0, 0)]):
+        twice_area += j * next_i - next_j * i
+        boundary += abs(next_i - i) + abs(next_j - j)
+        (i, j) = (next_i, next_j)
+    log.debug("2A:%s, b:%s", twice_area, boundary)
+    if not boundary:
+        return 0
+    return (abs(twice_area) + boundary) // 2 + 1
 
-class DigChannel(object):
-    def __init__(self, raw_data: str):
-        split = raw_data.split()
-        self.direction = split[0]
-        self.metres = int(split[1])
-        self.colour = split[2].replace("(", "").replace(")", "")
 
-    def __repr__(self):
-        return f"DigChannel({self.direction}, {self.metres}, {self.colour})"
+def measure_lagoon(plan: DigPlan, hex_encoded=False) -> int:
+    """Measure the lagoon for either the plain or the hex encoded reading of the dig plan"""
+    if hex_encoded:
+        return calculate_area(trace_vertices(plan.hex_directions, plan.hex_metres))
+    return calculate_area(trace_vertices(plan.directions, plan.metres))
 
 
-def dig_trench(instructions: list[DigChannel]) -> dict:
-    result = {}
-    i = j = 0
-    result[(i, j)] = "#"
-    for item in instructions:
-        if item.direction == "R":
-            result[(i, j)] = "#"
-            j += item.metres
-            result[(i, j)] = "#"
-        elif item.direction == "L":
-            result[(i, j)] = "#"
-            j -= item.metres
-            result[(i, j)] = "#"
-
-        elif item.direction == "D":
-            result[(i, j)] = "#"
-            i += item.metres
-            result[(i, j)] = "#"
-
-        elif item.direction == "U":
-            result[(i, j)] = "#"
-            i -= item.metres
-            result[(i, j)] = "#"
-
-    i_max = max(result.keys())[0]
-    j_max = max(result.keys())[1]
-    print(f"Max i,j {i_max},{j_max}")
-    return result
-
-
-def calculate_area(holes: list[tuple[int, int]], boundary_length: int) -> float:
-    # Cribbing from day 10:
-    # Using the shoelace formula - https://en.wikipedia.org/wiki/Shoelace_formula
-    # combined with Pick's theorem - https://en.wikipedia.org/wiki/Pick's_theorem
-    # Pick's theorem: A = i + (b/2) - 1, where
-    #  - A = area = 1/2 ((X1Y2 - X2Y1) + ... + (XnYn+1 - Xn+1Yn))
-    #  - i = interior points - what we're solving for
-    #  - b = boundary points (e.g. number of loop tiles)
-    # Therefore: i = A - (b/2) + 1
-    area = 0
-    for i in range(0, len(holes) - 1):
-        area_n = (holes[i][1] * holes[i + 1][0]) - (holes[i + 1][1] * holes[i][0])
-        area += area_n
-    # For the final point in the matrix, we must consider Xn,Yn and X0,Y0 to complete the boundary
-    area += (holes[-1][1] * holes[0][0]) - (holes[0][1] * holes[-1][0])
-    area = abs(area / 2)
-    internal = area - (boundary_length / 2) + 1
-    print(f"A:{area}, b:{boundary_length}, i:{internal}")
-    print(f"Sum: {boundary_length + internal}")
-    return boundary_length + area
-
-
-def convert_channels(channels: list[DigChannel]) -> list[DigChannel]:
-    new_channels = []
-    for channel in channels:
-        channel.direction = HEX_DIREX[int(channel.colour[-1])]
-        channel.metres = int(channel.colour[1 : len(channel.colour) - 1], 16)
-        new_channels.append(channel)
-    return new_channels
+def measure_lagoons(plan: DigPlan) -> tuple[int, int]:
+    """Measure the lagoon for both readings of a dig plan that has been decoded once"""
+    return measure_lagoon(plan), measure_lagoon(plan, hex_encoded=True)
+
+
+def parse_puzzle(raw_data: list[str]) -> DigPlan:
+    return parse_dig_plan("\n".join(raw_data).encode())
+
+
+def solve_part_1(plan: DigPlan) -> int:
+    return measure_lagoon(plan)
+
+
+def solve_part_2(plan: DigPlan) -> int:
+    return measure_lagoon(plan, hex_encoded=True)
 
 
 if __name__ == "__main__":
-    data = load_input("example.txt")
-    print(data)
-    channels = [DigChannel(row) for row in data]
-    dig_length = sum(i.metres for i in channels)
-    print(dig_length)
-    print(channels)
-    grid = dig_trench(channels)
-    dugout = [i for i in grid if grid[i] == "#"]
-    print(f"Total channel length: {dig_length}")
-    full_area = calculate_area(dugout, dig_length)
-
-    # Part 2
-    channels = convert_channels(channels)
-    print(channels)
-    grid = dig_trench(channels)
-    dig_length = sum(i.metres for i in channels)
-    dugout = [i for i in grid if grid[i] == "#"]
-    print(f"Total channel length: {len(dugout)}")
-    area = calculate_area(dugout, dig_length)
+    plan = load_dig_plan("example.txt")
+    log.debug("Plan %s", plan)
+    for answer in measure_lagoons(plan):
+        print(answer)
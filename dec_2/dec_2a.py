@@ -14,27 +14,28 @@ you 20 red cubes at once; similarly, game 4 would also have been impossible beca
  you 15 blue cubes at once. If you add up the IDs of the games that would have been possible, you get 8.
 """
 
-COLOURS = ["red", "green", "blue"]
+import logging
+from typing import Iterable, Iterator
+
+from common_functions import stream_input, TRACE
+
+log = logging.getLogger(__name__)
 
+# Only one line is needed at a time, so the aoc runner can hand over a stream of lines rather than a list
+STREAM_INPUT = True
 
-def load_input(filename: str) -> list:
-    """Given a filename, load the associated file as a list of strings"""
-    with open(filename, "r") as f:
-        file_content = f.readlines()
-    return file_content
+COLOURS = ["red", "green", "blue"]
 
 
-def parse_input(input_data: list) -> dict:
+def parse_input(input_data: Iterable[str]) -> Iterator[tuple[str, list[str]]]:
     """
-    Split a given list into a game dictionary, with the game ID as the key and the rounds as list items for values
+    Split each line into its game ID and a list of its rounds, yielding the games one at a time as the lines come in
     """
-    result = {}
     for line in input_data:
         data = line.split(":")
         game_id = data[0].split(" ")[1]
         games = data[1].split(";")
-        result[game_id] = games
-    return result
+        yield game_id, games
 
 
 def is_round_valid(round: str) -> bool:
@@ -51,28 +52,38 @@ def is_round_valid(round: str) -> bool:
     for colour in COLOURS:
         index = round.find(colour)
         if index != -1:
-            count = int(round[index - 3: index].strip())
+            count = int(round[index - 3 : index].strip())
             colour_count[colour] -= count
     for item in colour_count:
         if colour_count[item] < 0:
-            print(f"Colour: {item} count {colour_count[item]}")
+            if TRACE:
+                log.debug("Colour: %s count %s", item, colour_count[item])
             return False
     return True
 
 
-if __name__ == "__main__":
-    filename = "input_a.txt"
-    data = load_input(filename)
-    games = parse_input(data)
+def parse_puzzle(raw_data: Iterable[str]) -> Iterator[tuple[str, list[str]]]:
+    return parse_input(raw_data)
+
+
+def solve_part_1(games: Iterable[tuple[str, list[str]]]) -> int:
     game_tally = 0
-    for game in games:
+    for game, rounds in games:
         invalid_round = 0
-        for round in games[game]:
+        for round in rounds:
             if not is_round_valid(round):
-                print(f"Invalid round {game}")
+                if TRACE:
+                    log.debug("Invalid round %s", game)
                 invalid_round += 1
         if invalid_round == 0:
-            print(f"Valid game {game}")
+            if TRACE:
+                log.debug("Valid game %s", game)
             game_tally += int(game)
+    return game_tally
+
 
-    print(game_tally)
+if __name__ == "__main__":
+    filename = "input_a.txt"
+    data = stream_input(filename)
+    games = parse_puzzle(data)
+    print(solve_part_1(games))
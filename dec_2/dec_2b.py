@@ -21,23 +21,25 @@ For each game, find the minimum set of cubes that must have been present.
 What is the sum of the power of these sets?
 """
 
-COLOURS = ["red", "green", "blue"]
+import logging
+from typing import Iterable, Iterator
+
+from common_functions import stream_input, TRACE
+
+log = logging.getLogger(__name__)
 
+# Only one line is needed at a time, so the aoc runner can hand over a stream of lines rather than a list
+STREAM_INPUT = True
 
-def load_input(filename: str) -> list:
-    with open(filename, "r") as f:
-        file_content = f.readlines()
-    return file_content
+COLOURS = ["red", "green", "blue"]
 
 
-def parse_input(input_data: list) -> dict:
-    result = {}
+def parse_input(input_data: Iterable[str]) -> Iterator[tuple[str, list[str]]]:
     for line in input_data:
         data = line.split(":")
         game_id = data[0].split(" ")[1]
         games = data[1].split(";")
-        result[game_id] = games
-    return result
+        yield game_id, games
 
 
 def count_colours(round: str) -> dict:
@@ -54,30 +56,38 @@ def count_colours(round: str) -> dict:
     for colour in COLOURS:
         index = round.find(colour)
         if index != -1:
-            count = int(round[index - 3: index].strip())
+            count = int(round[index - 3 : index].strip())
             colour_count[colour] += count
     return colour_count
 
 
-if __name__ == "__main__":
-    filename = "input_a.txt"
-    data = load_input(filename)
-    games = parse_input(data)
+def parse_puzzle(raw_data: Iterable[str]) -> Iterator[tuple[str, list[str]]]:
+    return parse_input(raw_data)
+
+
+def solve_part_2(games: Iterable[tuple[str, list[str]]]) -> int:
     game_power_tally = 0
-    for game in games:
+    for game, rounds in games:
         colour_count = {
             "red": 0,
             "green": 0,
             "blue": 0,
         }
-        for round in games[game]:
+        for round in rounds:
             round_count = count_colours(round)
             for colour in round_count:
                 # If a new value is higher than the old one, we can drop the old value
                 if round_count[colour] > colour_count[colour]:
                     colour_count[colour] = round_count[colour]
         powers = colour_count["red"] * colour_count["green"] * colour_count["blue"]
-        print(f"Round {round} power {powers}")
+        if TRACE:
+            log.debug("Round %s power %s", round, powers)
         game_power_tally += powers
+    return game_power_tally
+
 
-    print(game_power_tally)
+if __name__ == "__main__":
+    filename = "input_a.txt"
+    data = stream_input(filename)
+    games = parse_puzzle(data)
+    print(solve_part_2(games))
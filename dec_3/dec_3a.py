@@ -19,9 +19,12 @@ Here is an example engine schematic:
 In this schematic, two numbers are not part numbers because they are not adjacent to a symbol: 114 (top right) and 58
 (middle right). Every other number is adjacent to a symbol and so is a part number; their sum is 4361.
 """
+import logging
 from re import findall
 
-from common_functions import load_input
+from common_functions import load_input, TRACE
+
+log = logging.getLogger(__name__)
 
 
 class PartNumber(object):
@@ -73,24 +76,35 @@ def format_numbers_to_indices(row: str) -> list[PartNumber]:
     return result
 
 
-if __name__ == "__main__":
-    data = load_input("example_a.txt")
-    # Reddit example should yield 925,6756
-    # Standard example should yield 4361, 467835
-    print(data)
-    # TODO: refactor this into proper functions
-    symbol_indices = [get_indices_of_symbols(i) for i in data]
-    digit_dict = [format_numbers_to_indices(i) for i in data]
+def parse_puzzle(raw_data: list[str]) -> (list[list[int]], list[list[PartNumber]]):
+    symbol_indices = [get_indices_of_symbols(i) for i in raw_data]
+    digit_dict = [format_numbers_to_indices(i) for i in raw_data]
+    return symbol_indices, digit_dict
+
+
+def solve_part_1(puzzle: (list[list[int]], list[list[PartNumber]])) -> int:
+    symbol_indices, digit_dict = puzzle
+    # Pad with empty rows so symbols on the first and last rows have rows either side of them
+    digit_dict = [[]] + digit_dict + [[]]
     part_count = []
     for i in range(len(symbol_indices)):
         if len(symbol_indices[i]) == 0:
             continue
         for symbol in symbol_indices[i]:
-            low = check_row_for_numbers(digit_dict[i - 1], symbol)
-            med = check_row_for_numbers(digit_dict[i], symbol)
-            high = check_row_for_numbers(digit_dict[i + 1], symbol)
+            low = check_row_for_numbers(digit_dict[i], symbol)
+            med = check_row_for_numbers(digit_dict[i + 1], symbol)
+            high = check_row_for_numbers(digit_dict[i + 2], symbol)
             part_count += low + med + high
-        print(
-            f"Data: {data[i].rstrip()}, symbols: {symbol_indices[i]} - parts: {part_count}"
-        )
-    print(sum(part_count))
+        if TRACE:
+            log.debug(
+                "Row %s, symbols: %s - parts: %s", i, symbol_indices[i], part_count
+            )
+    return sum(part_count)
+
+
+if __name__ == "__main__":
+    data = load_input("example_a.txt")
+    # Reddit example should yield 925,6756
+    # Standard example should yield 4361, 467835
+    print(data)
+    print(solve_part_1(parse_puzzle(data)))
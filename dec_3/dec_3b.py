@@ -24,9 +24,12 @@ it is only adjacent to one part number.) Adding up all of the gear ratios produc
 
 What is the sum of all of the gear ratios in your engine schematic?
 """
+import logging
 from re import findall
 
-from common_functions import load_input
+from common_functions import load_input, TRACE
+
+log = logging.getLogger(__name__)
 
 
 class PartNumber(object):
@@ -86,40 +89,39 @@ def find_gear_ratios(rows: list[list[PartNumber]], symbol_index: int) -> list[in
     # We can examine our rows symbol by symbol to find matches
     # We know we have a match of two items in a single row if their indices +1 and -1 overlap
     # We know that vertically and diagonally, our number indices must overlap or overlap given +1 and -1
-    def multiply_row(row: list):
-        return row[0][1] * row[1][1]
-
-    ratios = []
     low = check_row_for_numbers(rows[0], symbol_index)
     med = check_row_for_numbers(rows[1], symbol_index)
     high = check_row_for_numbers(rows[2], symbol_index)
-    for item in [low, med, high]:
-        if len(item) == 2:
-            ratios.append(multiply_row(item))
+    # A gear is a * next to exactly two part numbers, wherever those numbers sit
+    parts = low + med + high
+    if len(parts) == 2:
+        return [parts[0][1] * parts[1][1]]
+    return []
+
 
-    return ratios
+def parse_puzzle(raw_data: list[str]) -> (list[list[int]], list[list[PartNumber]]):
+    symbol_indices = [get_indices_of_symbols(i) for i in raw_data]
+    digit_dict = [format_numbers_to_indices(i) for i in raw_data]
+    return symbol_indices, digit_dict
+
+
+def solve_part_2(puzzle: (list[list[int]], list[list[PartNumber]])) -> int:
+    symbol_indices, digit_dict = puzzle
+    # Pad with empty rows so symbols on the first and last rows have rows either side of them
+    digit_dict = [[]] + digit_dict + [[]]
+    ratio_total = 0
+    for i in range(len(symbol_indices)):
+        for symbol in symbol_indices[i]:
+            ratio_total += sum(find_gear_ratios(digit_dict[i : i + 3], symbol))
+        if TRACE:
+            log.debug(
+                "Row %s, symbols: %s - ratios: %s", i, symbol_indices[i], ratio_total
+            )
+    return ratio_total
 
 
 if __name__ == "__main__":
     data = load_input("example_a.txt")
     # Standard example should yield 4361, 467835
     print(data)
-    # TODO: refactor this into proper functions
-    symbol_indices = [get_indices_of_symbols(i) for i in data]
-    digit_dict = [format_numbers_to_indices(i) for i in data]
-    part_count = []
-    for i in range(len(symbol_indices)):
-        if len(symbol_indices[i]) == 0:
-            continue
-        for symbol in symbol_indices[i]:
-            ratios = find_gear_ratios(
-                [digit_dict[i - 1], digit_dict[i], digit_dict[i + 1]], symbol
-            )
-            low = check_row_for_numbers(digit_dict[i - 1], symbol)
-            med = check_row_for_numbers(digit_dict[i], symbol)
-            high = check_row_for_numbers(digit_dict[i + 1], symbol)
-            part_count += low + med + high
-        print(
-            f"Data: {data[i].rstrip()}, symbols: {symbol_indices[i]} - parts: {part_count}"
-        )
-    print(sum(part_count))
+    print(solve_part_2(parse_puzzle(data)))
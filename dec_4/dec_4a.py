@@ -28,7 +28,15 @@ So, in this example, the Elf's pile of scratchcards is worth 13 points.
 Take a seat in the large pile of colorful cards. How many points are they worth in total?
 """
 
-from common_functions import load_input
+import logging
+from typing import Iterable, Iterator
+
+from common_functions import stream_input, TRACE
+
+log = logging.getLogger(__name__)
+
+# Only one line is needed at a time, so the aoc runner can hand over a stream of lines rather than a list
+STREAM_INPUT = True
 
 
 class Game(object):
@@ -39,9 +47,11 @@ class Game(object):
         self.player_numbers = game[1].split()
 
 
-if __name__ == "__main__":
-    data = load_input("input_a.txt")
-    games = [Game(row.rstrip()) for row in data]
+def parse_puzzle(raw_data: Iterable[str]) -> Iterator[Game]:
+    return (Game(row.rstrip()) for row in raw_data)
+
+
+def solve_part_1(games: Iterable[Game]) -> int:
     total_score = 0
     for game in games:
         tally = 0
@@ -51,6 +61,12 @@ if __name__ == "__main__":
                     tally = 1
                 else:
                     tally *= 2
-        print(f"{game.game_number}: {tally}")
+        if TRACE:
+            log.debug("%s: %s", game.game_number, tally)
         total_score += tally
-    print(total_score)
+    return total_score
+
+
+if __name__ == "__main__":
+    data = stream_input("input_a.txt")
+    print(solve_part_1(Game(row.rstrip()) for row in data))
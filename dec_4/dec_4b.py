@@ -37,7 +37,16 @@ Process all of the original and copied scratchcards until no more scratchcards a
 scratchcards, how many total scratchcards do you end up with?
 """
 
-from common_functions import load_input
+import logging
+from collections import deque
+from typing import Iterable, Iterator
+
+from common_functions import stream_input, TRACE
+
+log = logging.getLogger(__name__)
+
+# Only one line is needed at a time, so the aoc runner can hand over a stream of lines rather than a list
+STREAM_INPUT = True
 
 
 class Game(object):
@@ -46,29 +55,39 @@ class Game(object):
         game = game_input.split(": ")[1].split("|")
         self.winning_numbers = game[0].split()
         self.player_numbers = game[1].split()
-        self.win_count = 0
-        self.play_count = 1
 
 
 def count_winning_numbers(game: Game) -> int:
     return len(list(set(game.winning_numbers) & set(game.player_numbers)))
 
 
-if __name__ == "__main__":
-    data = load_input("input_a.txt")
-    games = [Game(row.rstrip()) for row in data]
-    game_count = len(games)
-    tally = 0  # Since we always end up with 1 copy of card 1
+def parse_puzzle(raw_data: Iterable[str]) -> Iterator[Game]:
+    return (Game(row.rstrip()) for row in raw_data)
+
+
+def solve_part_2(games: Iterable[Game]) -> int:
+    # Cards only ever win copies of the cards directly below them, so rather than holding every card we keep a queue of
+    # the extra copies won for the next few cards and consume it as the cards stream in. The counts are kept here rather
+    # than on the games, so the same parsed games can be solved more than once
+    extra_copies = deque()
+    tally = 0
     for game in games:
-        for i in range(0, game.play_count):
-            game.win_count = count_winning_numbers(game)
-            print(
-                f"{game.game_number}: wins {game.win_count}, play count: {game.play_count}"
+        # We always have the original card, plus any copies won by the cards above it
+        play_count = 1 + (extra_copies.popleft() if extra_copies else 0)
+        win_count = count_winning_numbers(game)
+        if TRACE:
+            log.debug(
+                "%s: wins %s, play count: %s", game.game_number, win_count, play_count
             )
-            index = int(game.game_number) + 1
-            for i in range(index, index + game.win_count):
-                games[i - 1].play_count += 1
-                print(f"Extra game {i} - {games[i - 1].play_count}")
-        tally += game.play_count
+        # Every copy of this card wins one copy of each of the next win_count cards
+        while len(extra_copies) < win_count:
+            extra_copies.append(0)
+        for i in range(win_count):
+            extra_copies[i] += play_count
+        tally += play_count
+    return tally
 
-    print(f"Tally {tally}")
+
+if __name__ == "__main__":
+    data = stream_input("input_a.txt")
+    print(f"Tally {solve_part_2(Game(row.rstrip()) for row in data)}")
@@ -106,7 +106,16 @@ So, the lowest location number in this example is 35.
 What is the lowest location number that corresponds to any of the initial seed numbers?
 """
 
-from common_functions import load_input
+import hashlib
+import json
+import logging
+import os
+from bisect import bisect_right
+from typing import Iterable, Optional
+
+from common_functions import TRACE, load_input, numpy
+
+log = logging.getLogger(__name__)
 
 
 class MapRanges(object):
@@ -118,7 +127,11 @@ class MapRanges(object):
 class AlmanacMap(object):
     def __init__(self, name: str, entries: list[str]):
         self.name = name
-        self.entries = self.process_entries(entries)
+        # Sorted by source start so the entry for any value can be found by binary search
+        self.entries = sorted(
+            self.process_entries(entries), key=lambda entry: entry.source.start
+        )
+        self.starts = [entry.source.start for entry in self.entries]
 
     @staticmethod
     def process_entries(entries: list[str]) -> list[MapRanges]:
@@ -132,9 +145,9 @@ class AlmanacMap(object):
 def extract_map_blocks(raw_data: list[str]) -> list[AlmanacMap]:
     result = []
     temp_list = []
-    raw_data.append("\n")  # Add a new line to make data consistent
-    for row in raw_data:
-        if row[0].isalnum():
+    # Add an empty row to make data consistent
+    for row in raw_data + [""]:
+        if row and row[0].isalnum():
             temp_list.append(row)
             continue
         result.append(AlmanacMap(temp_list[0], temp_list[1:]))
@@ -143,57 +156,206 @@ def extract_map_blocks(raw_data: list[str]) -> list[AlmanacMap]:
     return result
 
 
+def find_entry(search_value: int, map_block: AlmanacMap) -> Optional[MapRanges]:
+    """Binary search for the entry whose source range contains a value, if there is one"""
+    index = bisect_right(map_block.starts, search_value) - 1
+    if index >= 0 and search_value in map_block.entries[index].source:
+        return map_block.entries[index]
+    return None
+
+
 def convert_value_with_map(search_value: int, map_block: AlmanacMap) -> int:
-    for entries in map_block.entries:
-        if search_value in entries.source:
-            return entries.destination[entries.source.index(search_value)]
-    return search_value
+    entry = find_entry(search_value, map_block)
+    if entry is None:
+        return search_value
+    return entry.destination.start + search_value - entry.source.start
 
 
-def get_range_overlap(r1: range, r2: range) -> range or None:
-    return (
-        range(
-            max(r1.start, r2.start),
-            min(r1.stop, r2.stop),
-        )
-        or None
-    )
-
-
-def compare_ranges(r1: range, r2: range, destination: range) -> list[range]:
-    # We have 5 possible situations:
-    # 1. There is no overlap between seed and source |---Se----|<-------So------> -> Return only seed
-    overlap = get_range_overlap(r1, r2)
-    if overlap is None:
-        return [r1]
-    # We can now find the destination indices and convert the overlap:
-    start_index = r2.index(overlap.start)
-    stop_index = r2.index(overlap.stop)
-    overlap = destination[start_index:stop_index]
-    result = [overlap]
-    # 2. Source overlaps and extends beyond seed |---Se-<---|----So--------> -> Return underlap and matching
-    if r1.start < r2.start and r1.stop < r2.stop:
-        result.append(range(r1.start, r2[r2.index(r1.stop)]))
-    # 3. Seed contains all of source |---Se----<-------So------>---| -> Return underlap, overlap and matching
-    if r1.start < r2.start and r1.stop > r2.stop:
-        result.append(range(r1.start, r2.start))
-        result.append(range(r2.stop, r1.stop))
-    # 4. Source starts before seed and extends beyond source <---So---|---Se-->--| -> Return matching and post-match
-    if r2.start < r1.start and r1.stop > r2.stop:
-        result.append(range(r2.stop, r1.stop))
-    # 5. Source is larger in than seed <---|---Se----|---So------> -> Return only matching
-    # if r2.start < r1.start and r2.stop > r1.stop:
-    #     return [overlap]
+def convert_range_with_map(seed_range: range, map_block: AlmanacMap) -> list[range]:
+    """
+    Split a range of values at the edges of the map entries it crosses, shifting the pieces covered by an entry and
+    passing the gaps between entries through unchanged
+    """
+    result = []
+    start = seed_range.start
+    # Start from the last entry beginning at or before the range, as it may still overlap it
+    index = max(bisect_right(map_block.starts, start) - 1, 0)
+    while start < seed_range.stop:
+        if index == len(map_block.entries):
+            result.append(range(start, seed_range.stop))
+            break
+        entry = map_block.entries[index]
+        if entry.source.stop <= start:
+            index += 1
+            continue
+        if start < entry.source.start:
+            stop = min(seed_range.stop, entry.source.start)
+            result.append(range(start, stop))
+        else:
+            stop = min(seed_range.stop, entry.source.stop)
+            offset = entry.destination.start - entry.source.start
+            result.append(range(start + offset, stop + offset))
+        start = stop
+    return result
+
+
+def merge_ranges(ranges: list[range]) -> list[range]:
+    """Sort ranges and join any that overlap or touch, so the number of ranges stays small from block to block"""
+    result = []
+    for r in sorted(ranges, key=lambda r: r.start):
+        if result and r.start <= result[-1].stop:
+            if r.stop > result[-1].stop:
+                result[-1] = range(result[-1].start, r.stop)
+            continue
+        result.append(r)
     return result
+
+
+def convert_ranges_with_maps(
+    seed_ranges: list[range], map_blocks: list[AlmanacMap]
+) -> list[range]:
+    for block in map_blocks:
+        converted = []
+        for seed_range in seed_ranges:
+            converted += convert_range_with_map(seed_range, block)
+        seed_ranges = merge_ranges(converted)
+        if TRACE:
+            log.debug("%s: %s ranges", block.name, len(seed_ranges))
+    return seed_ranges
+
+
+class ComposedMap(object):
+    """
+    The whole chain of maps as one piecewise linear function. Values from breakpoints[i] up to breakpoints[i + 1] are
+    shifted by offsets[i], and the last segment runs on forever, so a lookup is a single binary search
+    """
+
+    def __init__(self, breakpoints: list[int], offsets: list[int]):
+        self.breakpoints = breakpoints
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.breakpoints)
+
+    def __call__(self, value: int) -> int:
+        return value + self.offsets[bisect_right(self.breakpoints, value) - 1]
+
+    def segments(self) -> Iterable[tuple[int, Optional[int], int]]:
+        """Yield each segment as start, stop and offset, with None as the stop of the last one"""
+        stops = self.breakpoints[1:] + [None]
+        return zip(self.breakpoints, stops, self.offsets)
+
+    def then(self, map_block: AlmanacMap) -> "ComposedMap":
+        """Compose with one more map, splitting each segment where its image crosses an edge of the map's entries"""
+        breakpoints = []
+        offsets = []
+        last_stop = map_block.entries[-1].source.stop if map_block.entries else 0
+        for start, stop, offset in self.segments():
+            if stop is None:
+                # Only the part of the last segment that reaches the map's entries needs splitting - past that the
+                # final piece carries on unchanged
+                stop = max(start + offset, last_stop) - offset + 1
+            for piece in convert_range_with_map(
+                range(start + offset, stop + offset), map_block
+            ):
+                piece_offset = piece.start - start
+                if not offsets or offsets[-1] != piece_offset:
+                    breakpoints.append(start)
+                    offsets.append(piece_offset)
+                start += len(piece)
+        return ComposedMap(breakpoints, offsets)
+
+    def map_values(self, values):
+        """
+        Map a whole batch of values at once, always returning a list of ints. With NumPy this is one vectorised
+        search over an array, otherwise it falls back to single lookups
+        """
+        if numpy is None:
+            return [self(value) for value in values]
+        values = numpy.asarray(values, dtype=numpy.int64)
+        indices = numpy.searchsorted(self.breakpoints, values, side="right") - 1
+        return (
+            values + numpy.asarray(self.offsets, dtype=numpy.int64)[indices]
+        ).tolist()
+
+    def save(self, filename: str, key: str = None):
+        with open(filename, "w") as f:
+            json.dump(
+                {"key": key, "breakpoints": self.breakpoints, "offsets": self.offsets},
+                f,
+            )
+
+    @classmethod
+    def load(cls, filename: str, key: str = None) -> Optional["ComposedMap"]:
+        """Load a saved map, or return None if there isn't one or it was saved for a different almanac"""
+        if not os.path.exists(filename):
+            return None
+        with open(filename) as f:
+            data = json.load(f)
+        if data["key"] != key:
+            return None
+        return cls(data["breakpoints"], data["offsets"])
+
+
+def compose_maps(map_blocks: list[AlmanacMap]) -> ComposedMap:
+    # Values are never negative, so everything starts off in a single segment that leaves them alone
+    composed = ComposedMap([0], [0])
+    for block in map_blocks:
+        composed = composed.then(block)
+        if TRACE:
+            log.debug("after %s: %s segments", block.name, len(composed))
+    return composed
+
+
+def almanac_key(map_blocks: list[AlmanacMap]) -> str:
+    """A fingerprint of the maps, so a cached composed map is never used for a different almanac"""
+    digest = hashlib.sha256()
+    for block in map_blocks:
+        digest.update(block.name.encode())
+        for entry in block.entries:
+            digest.update(
+                f"{entry.destination.start} {entry.source.start} {len(entry.source)};".encode()
+            )
+    return digest.hexdigest()
+
+
+def load_composed_maps(map_blocks: list[AlmanacMap], filename: str) -> ComposedMap:
+    """Compose the maps, reusing the copy cached in a file when it was made from the same almanac"""
+    key = almanac_key(map_blocks)
+    composed = ComposedMap.load(filename, key)
+    if composed is None:
+        composed = compose_maps(map_blocks)
+        composed.save(filename, key)
+    return composed
+
+
+def parse_puzzle(raw_data: list[str]) -> (list[int], list[AlmanacMap]):
+    seeds = [int(seed) for seed in raw_data[0].rstrip().split()[1:]]
+    map_blocks = extract_map_blocks(raw_data[2:])
+    return seeds, map_blocks
+
+
+def solve_part_1(puzzle: (list[int], list[AlmanacMap])) -> int:
+    seeds, map_blocks = puzzle
+    result = compose_maps(map_blocks).map_values(seeds)
+    lowest = min(result)
+    if TRACE:
+        log.debug("%s - min %s", result, lowest)
+    return lowest
+
+
+def solve_part_2(puzzle: (list[int], list[AlmanacMap])) -> int:
+    """The seeds line is really pairs of range starts and lengths, so push the whole ranges through the maps"""
+    seeds, map_blocks = puzzle
+    seed_ranges = [
+        range(start, start + length) for start, length in zip(seeds[::2], seeds[1::2])
+    ]
+    locations = convert_ranges_with_maps(merge_ranges(seed_ranges), map_blocks)
+    return locations[0].start
+
+
 if __name__ == "__main__":
     data = load_input("example.txt")
-    seeds = data[0].rstrip().split()
-    map_blocks = extract_map_blocks(data[2:])
-    result = []
-    for seed in seeds[1:]:
-        seed = int(seed)
-        for block in map_blocks:
-            seed = convert_value_with_map(seed, block)
-        result.append(seed)
-    print(f"{result} - min {min(result)}")
-    pass
+    puzzle = parse_puzzle(data)
+    print(solve_part_1(puzzle))
+    print(solve_part_2(puzzle))
@@ -53,9 +53,13 @@ Determine the number of ways you could beat the record in each race. What do you
 together?
 """
 
-from common_functions import load_input
+import logging
 from re import findall
 
+from common_functions import load_input, TRACE
+
+log = logging.getLogger(__name__)
+
 
 class SingleRace(object):
     def __init__(self, time: int, distance: int):
@@ -76,14 +80,7 @@ def calculate_distance_travelled(t_press, t_total):
     return t_press * (t_total - t_press)
 
 
-if __name__ == "__main__":
-    data = load_input("example.txt")
-    part_2 = True
-    if part_2:
-        data = [i.split(":")[1].replace(" ", "") for i in data]
-    print(data)
-    parsed_data = parse_raw_data(data)
-    print(parsed_data)
+def count_winning_rounds(parsed_data: list[SingleRace]) -> int:
     winning_rounds = 1
     for race in parsed_data:
         tally = 0
@@ -91,7 +88,27 @@ if __name__ == "__main__":
             new_record = calculate_distance_travelled(i + 1, race.time)
             if new_record > race.distance:
                 tally += 1
-        print(f"Race: {tally}")
         winning_rounds *= tally
-        print(f"Winning_rounds: {winning_rounds}")
-    pass
+        if TRACE:
+            log.debug("Race: %s, winning rounds: %s", tally, winning_rounds)
+    return winning_rounds
+
+
+def parse_puzzle(raw_data: list[str]) -> list[str]:
+    return raw_data
+
+
+def solve_part_1(puzzle: list[str]) -> int:
+    return count_winning_rounds(parse_raw_data(puzzle))
+
+
+def solve_part_2(puzzle: list[str]) -> int:
+    # The spaces between numbers are just bad kerning - there is only one race
+    puzzle = [i.split(":")[1].replace(" ", "") for i in puzzle]
+    return count_winning_rounds(parse_raw_data(puzzle))
+
+
+if __name__ == "__main__":
+    data = load_input("example.txt")
+    print(solve_part_1(data))
+    print(solve_part_2(data))
@@ -51,10 +51,18 @@ with its rank (765 * 1 + 220 * 2 + 28 * 3 + 684 * 4 + 483 * 5). So the total win
 Find the rank of every hand in your set. What are the total winnings?
 """
 
+import logging
 from collections import namedtuple, Counter
 from operator import attrgetter
+from typing import Iterable
 
-from common_functions import load_input
+from common_functions import stream_input, TRACE
+
+log = logging.getLogger(__name__)
+
+# Every hand has to be held to rank them, but reading a stream of lines from the aoc runner saves holding the raw lines
+# as well
+STREAM_INPUT = True
 
 FACE_VALUES = {
     "A": "M",
@@ -72,6 +80,23 @@ FACE_VALUES = {
     "2": "A",
 }
 
+# In part 2 J is a joker, which is the weakest card
+JOKER_FACE_VALUES = {
+    "A": "M",
+    "K": "L",
+    "Q": "K",
+    "T": "J",
+    "9": "I",
+    "8": "H",
+    "7": "G",
+    "6": "F",
+    "5": "E",
+    "4": "D",
+    "3": "C",
+    "2": "B",
+    "J": "A",
+}
+
 Hand = namedtuple("Hand", "cards bid value alpha")
 
 
@@ -106,7 +131,8 @@ def get_hand_value_part_2(hand: str) -> int:
     )
     # Whoops! Here's an edge case
     if hand == "JJJJJ":
-        print("JJJJ hand!")
+        if TRACE:
+            log.debug("JJJJ hand!")
         return get_hand_value(hand)
     for letter in hand:
         new_letter = letter
@@ -116,61 +142,51 @@ def get_hand_value_part_2(hand: str) -> int:
     return get_hand_value(replacement_hand)
 
 
-def transform_hand_to_alpha(hand: str) -> str:
+def transform_hand_to_alpha(hand: str, face_values: dict = None) -> str:
+    face_values = face_values or FACE_VALUES
     digits = ""
     for letter in hand:
-        digits = digits + FACE_VALUES[letter]
+        digits = digits + face_values[letter]
     return digits
 
 
-if __name__ == "__main__":
-    data = load_input("example.txt")
-    cards = [
-        Hand(
-            item.split()[0],
-            item.split()[1],
-            get_hand_value(item.split()[0]),
-            transform_hand_to_alpha(item.split()[0]),
-        )
-        for item in data
-    ]
-    print(cards)
+def calculate_winnings(cards: list[Hand]) -> int:
     sorted_cards = sorted(cards, key=attrgetter("value", "alpha"))
-    print(sorted_cards)
+    if TRACE:
+        log.debug("Sorted cards %s", sorted_cards)
     winnings = 0
     for index, _ in enumerate(sorted_cards):
         winnings += (index + 1) * int(sorted_cards[index].bid)
-    print(winnings)
-    print("\nPart 2!\n")
-    FACE_VALUES = {
-        "A": "M",
-        "K": "L",
-        "Q": "K",
-        "T": "J",
-        "9": "I",
-        "8": "H",
-        "7": "G",
-        "6": "F",
-        "5": "E",
-        "4": "D",
-        "3": "C",
-        "2": "B",
-        "J": "A",
-    }
+    return winnings
+
+
+def parse_puzzle(raw_data: Iterable[str]) -> list[tuple[str, str]]:
+    return [tuple(item.split()) for item in raw_data]
+
+
+def solve_part_1(puzzle: list[tuple[str, str]]) -> int:
+    cards = [
+        Hand(cards, bid, get_hand_value(cards), transform_hand_to_alpha(cards))
+        for cards, bid in puzzle
+    ]
+    return calculate_winnings(cards)
+
+
+def solve_part_2(puzzle: list[tuple[str, str]]) -> int:
     cards = [
         Hand(
-            item.split()[0],
-            item.split()[1],
-            get_hand_value_part_2(item.split()[0]),
-            transform_hand_to_alpha(item.split()[0]),
+            cards,
+            bid,
+            get_hand_value_part_2(cards),
+            transform_hand_to_alpha(cards, JOKER_FACE_VALUES),
         )
-        for item in data
+        for cards, bid in puzzle
     ]
-    print(cards)
-    sorted_cards = sorted(cards, key=attrgetter("value", "alpha"))
-    print(sorted_cards)
-    winnings = 0
-    for index, _ in enumerate(sorted_cards):
-        winnings += (index + 1) * int(sorted_cards[index].bid)
-    print(winnings)
-    pass
+    return calculate_winnings(cards)
+
+
+if __name__ == "__main__":
+    data = parse_puzzle(stream_input("example.txt"))
+    print(solve_part_1(data))
+    print("\nPart 2!\n")
+    print(solve_part_2(data))
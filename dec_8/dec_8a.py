@@ -31,12 +31,15 @@ ZZZ = (ZZZ, ZZZ)
 Starting at AAA, follow the left/right instructions. How many steps are required to reach ZZZ?
 """
 
+import logging
 from collections import namedtuple
 from re import findall
 from math import lcm
 
 from common_functions import load_input
 
+log = logging.getLogger(__name__)
+
 Node = namedtuple("Node", "name left right")
 
 
@@ -60,11 +63,14 @@ def get_next_node(node: Node, direction: str) -> str:
         return node.right
 
 
-if __name__ == "__main__":
-    sample = load_input("example_a.txt")
-    instructions = sample[0].rstrip()
-    print(instructions)
-    nodes = parse_nodes(sample[2:])
+def parse_puzzle(raw_data: list[str]) -> (str, dict):
+    instructions = raw_data[0].rstrip()
+    nodes = parse_nodes(raw_data[2:])
+    return instructions, nodes
+
+
+def solve_part_1(puzzle: (str, dict)) -> int:
+    instructions, nodes = puzzle
     goal = nodes["AAA"]
     tally = 0
     while goal.name != "ZZZ":
@@ -72,16 +78,13 @@ if __name__ == "__main__":
             tally += 1
             next_node = get_next_node(nodes[goal.name], instruction)
             goal = nodes[next_node]
-    print(tally)
-    # part 2!
-    print("Part 2!")
-    tally = 0
-    sample = load_input("example_2.txt")
-    instructions = sample[0].rstrip()
-    print(f"Instructions {instructions}")
-    nodes = parse_nodes(sample[2:])
+    return tally
+
+
+def solve_part_2(puzzle: (str, dict)) -> int:
+    instructions, nodes = puzzle
     check_nodes = [nodes[node] for node in nodes if nodes[node].name.endswith("A")]
-    print(f"Starting nodes: {check_nodes}")
+    log.debug("Starting nodes: %s", check_nodes)
     z_factors = []
     for node in check_nodes:
         tally = 0
@@ -91,6 +94,14 @@ if __name__ == "__main__":
                 node = nodes[next_round]
                 tally += 1
         z_factors.append(tally)
-    print(z_factors)
-    print(lcm(*z_factors))
-    pass
+    log.debug("Steps to reach Z: %s", z_factors)
+    return lcm(*z_factors)
+
+
+if __name__ == "__main__":
+    sample = load_input("example_a.txt")
+    print(solve_part_1(parse_puzzle(sample)))
+    # part 2!
+    print("Part 2!")
+    sample = load_input("example_2.txt")
+    print(solve_part_2(parse_puzzle(sample)))
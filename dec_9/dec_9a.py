@@ -76,11 +76,19 @@ If you find the next value for each history in this example and add them togethe
 Analyze your OASIS report and extrapolate the next value for each history. What is the sum of these extrapolated values?
 """
 
-from common_functions import load_input
+import logging
+from typing import Iterable, Iterator
 
+from common_functions import stream_input, TRACE
 
-def parse_data_to_ints(data: list[str]) -> list[list[int]]:
-    return [list(map(int, row.split())) for row in data]
+log = logging.getLogger(__name__)
+
+# Only one line is needed at a time, so the aoc runner can hand over a stream of lines rather than a list
+STREAM_INPUT = True
+
+
+def parse_data_to_ints(data: Iterable[str]) -> Iterator[list[int]]:
+    return (list(map(int, row.split())) for row in data)
 
 
 def get_previous_sequence(sequence: list[int]) -> list[int]:
@@ -89,34 +97,32 @@ def get_previous_sequence(sequence: list[int]) -> list[int]:
 
 def iterate_over_sequences(sequence: list[int]) -> list[int]:
     history = [sequence]
-    print(f"Initial sequence: {sequence}")
+    if TRACE:
+        log.debug("Initial sequence: %s", sequence)
     while sum(sequence) != 0:
         sequence = get_previous_sequence(sequence)
-        print(f"Iteration: {sequence}")
+        if TRACE:
+            log.debug("Iteration: %s", sequence)
         history.append(sequence)
-    print(f"Histories: {history}")
+    if TRACE:
+        log.debug("Histories: %s", history)
     return [i[-1] for i in history]
 
 
+def parse_puzzle(raw_data: Iterable[str]) -> Iterator[list[int]]:
+    return parse_data_to_ints(raw_data)
+
+
+def solve_part_1(puzzle: Iterable[list[int]]) -> int:
+    return sum(sum(iterate_over_sequences(row)) for row in puzzle)
+
+
+def solve_part_2(puzzle: Iterable[list[int]]) -> int:
+    # Predicting backwards is the same as predicting forwards on the reversed history
+    return sum(sum(iterate_over_sequences(row[::-1])) for row in puzzle)
+
+
 if __name__ == "__main__":
-    data = load_input("example.txt")
-    print(data)
-    data = parse_data_to_ints(data)
-    print(data)
-    total = 0
-    for row in data:
-        histories = iterate_over_sequences(row)
-        print(histories)
-        total += sum(histories)
-        print(total)
-
-    print("Part 2!")
-    print(f"Initial data: {data}")
-    [row.reverse() for row in data]
-    print(f"Initial data: {data}")
-    total = 0
-    for row in data:
-        histories = iterate_over_sequences(row)
-        print(histories)
-        total += sum(histories)
-        print(total)
+    # Each part makes its own pass over the file, holding only one row at a time
+    print(f"Part 1: {solve_part_1(parse_puzzle(stream_input('example.txt')))}")
+    print(f"Part 2: {solve_part_2(parse_puzzle(stream_input('example.txt')))}")
@@ -0,0 +1,4 @@
+"""
+Tests for the shared helpers and the daily solutions, run from the repo root with
+python -m pytest -q
+"""
@@ -0,0 +1,104 @@
+"""
+Simple, slow versions of the solutions the faster algorithms replaced, for the tests and benchmarks to check against
+"""
+from itertools import product
+from typing import Iterable
+
+from common_functions import transpose_data
+from dec_5.dec_5a import AlmanacMap, convert_value_with_map
+from dec_10.dec_10a import Maze, NORTH, trace_loop
+from dec_16.dec_16 import compute_next_direction
+
+
+def walk_maps(seeds: list[int], map_blocks: list[AlmanacMap]) -> list[int]:
+    """Look each seed up in every map in turn"""
+    result = []
+    for seed in seeds:
+        for block in map_blocks:
+            seed = convert_value_with_map(seed, block)
+        result.append(seed)
+    return result
+
+
+def brute_force_arrangements(conditions: str, groups: tuple[int]) -> int:
+    """Try every way of filling in the unknown springs"""
+    unknown = [i for i, char in enumerate(conditions) if char == "?"]
+    count = 0
+    for filling in product(".#", repeat=len(unknown)):
+        row = list(conditions)
+        for i, char in zip(unknown, filling):
+            row[i] = char
+        if tuple(len(run) for run in "".join(row).split(".") if run) == groups:
+            count += 1
+    return count
+
+
+def count_enclosed_by_crossings(maze: Maze) -> int:
+    """Count the tiles off the loop that have an odd number of loop pipes heading north anywhere to their left"""
+    loop = {index for index, _ in trace_loop(maze)}
+    enclosed = 0
+    for i in range(maze.grid.height):
+        inside = False
+        for index in range(i * maze.grid.width, (i + 1) * maze.grid.width):
+            if index in loop:
+                inside ^= bool(maze.masks[index] & NORTH)
+            else:
+                enclosed += inside
+    return enclosed
+
+
+def move_rocks_as_strings(puzzle: Iterable[str]) -> list[str]:
+    """move_rocks_as_strings as it was before the bitboard Platform replaced it"""
+    # Assuming initially we are always only moving things north
+    return_puzzle = []
+    for original_row in puzzle:
+        # Find fixed rocks to be reinserted later
+        fixed_rocks = [j for j in range(len(original_row)) if original_row[j] == "#"]
+        # Remove the fixed rocks so we can collapse the mobile rocks within a row
+        new_rows = original_row.split("#")
+        updated_row = ""
+        for row in new_rows:
+            rock_count = row.count("O")
+            updated_row = (
+                updated_row + "O" * rock_count + ("." * (len(row) - rock_count))
+            )
+        # Reinserted the fixed rocks
+        for rock in fixed_rocks:
+            updated_row = updated_row[:rock] + "#" + updated_row[rock:]
+        return_puzzle.append(updated_row)
+    return return_puzzle
+
+
+def cycle_rocks(puzzle: list[str]) -> list[str]:
+    """cycle_rocks as it was before the bitboard Platform replaced it"""
+    # Rocks roll towards the start of each string, so tilting the transposed columns moves them north
+    north_puzzle = transpose_data(move_rocks_as_strings(transpose_data(puzzle)))
+    west_puzzle = move_rocks_as_strings(north_puzzle)
+
+    # Reversing each column or row before tilting rolls the rocks the other way
+    south_puzzle = move_rocks_as_strings(
+        col[::-1] for col in transpose_data(west_puzzle)
+    )
+    south_puzzle = transpose_data([col[::-1] for col in south_puzzle])
+    east_puzzle = move_rocks_as_strings(row[::-1] for row in south_puzzle)
+    east_puzzle = [row[::-1] for row in east_puzzle]
+    return east_puzzle
+
+
+def energise(rows: list[str], pos: tuple[int, int], direction: tuple[int, int]) -> int:
+    """Follow a beam through the contraption one tile at a time, counting the tiles it passes through"""
+    seen = set()
+    queue = [(pos, direction)]
+    while queue:
+        (pos, direction) = beam = queue.pop()
+        if beam in seen or not (0 <= pos[0] < len(rows) and 0 <= pos[1] < len(rows[0])):
+            continue
+        seen.add(beam)
+        for next_direction in compute_next_direction(rows[pos[0]][pos[1]], direction):
+            queue.append(
+                (
+                    (pos[0] + next_direction[0], pos[1] + next_direction[1]),
+                    next_direction,
+                )
+            )
+    return len({pos for pos, _ in seen})
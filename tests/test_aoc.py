@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+import aoc
+
+# The examples from the puzzle text for the days without example files
+EXAMPLES = {
+    (1, 1): (["1abc2", "pqr3stu8vwx", "a1b2c3d4e5f", "treb7uchet"], 142),
+    (1, 2): (
+        [
+            "two1nine",
+            "eightwothree",
+            "abcone2threexyz",
+            "xtwone3four",
+            "4nineeightseven2",
+            "zoneight234",
+            "7pqrstsixteen",
+        ],
+        281,
+    ),
+    (2, 1): (
+        [
+            "Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green",
+            "Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue",
+            "Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red",
+            "Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red",
+            "Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green",
+        ],
+        8,
+    ),
+}
+EXAMPLES[2, 2] = (EXAMPLES[2, 1][0], 2286)
+
+
+def no_load_input(filename: str):
+    raise AssertionError(f"{filename} was loaded whole")
+
+
+@pytest.mark.parametrize(
+    "day, filename, part, answer",
+    [
+        (4, "example_a.txt", 1, 13),
+        (4, "example_a.txt", 2, 30),
+        (7, "example.txt", 1, 6440),
+        (9, "example.txt", 1, 114),
+        (9, "example.txt", 2, 2),
+    ],
+)
+def test_streaming_days_never_load_the_whole_input(
+    monkeypatch, day: int, filename: str, part: int, answer: int
+):
+    monkeypatch.setattr(aoc, "load_input", no_load_input)
+    timing = aoc.run_part(
+        day, part, os.path.join(aoc.REPO_ROOT, f"dec_{day}", filename)
+    )
+    assert timing.status == "ok"
+    assert timing.answer == answer
+
+
+@pytest.mark.parametrize("day, part", sorted(EXAMPLES))
+def test_streaming_days_from_the_puzzle_text(
+    monkeypatch, tmp_path, day: int, part: int
+):
+    (lines, answer) = EXAMPLES[day, part]
+    path = tmp_path / "example.txt"
+    # Windows line endings are read the same way
+    path.write_bytes("\r\n".join(lines).encode() + b"\r\n")
+    monkeypatch.setattr(aoc, "load_input", no_load_input)
+    timing = aoc.run_part(day, part, str(path))
+    assert timing.status == "ok"
+    assert timing.answer == answer
@@ -0,0 +1,108 @@
+import random
+
+import pytest
+
+from common_functions import (
+    find_cycle,
+    load_input,
+    stream_input,
+    strongly_connected_components,
+    Grid,
+)
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        b"",
+        b"\n",
+        b"one\ntwo\n",
+        b"one\ntwo",
+        b"one\r\n\r\ntwo\r\n",
+        b"one\r\r\ntwo\r",
+        # Form feeds, group separators and Unicode line separators are not line breaks
+        b"page\x0cbreak\x1cfile\x1dgroup\x1erecord\ntext\xe2\x80\xa8line\n",
+    ],
+)
+def test_load_input_splits_lines_like_stream_input(tmp_path, contents: bytes):
+    path = tmp_path / "input.txt"
+    path.write_bytes(contents)
+    assert load_input(str(path)) == list(stream_input(str(path)))
+
+
+def test_grid_rejects_ragged_rows():
+    with pytest.raises(ValueError, match="Row 1"):
+        Grid(["123", "45", "6789"])
+    with pytest.raises(ValueError, match="Row 2"):
+        Grid(["12", "34", ""])
+
+
+def test_grid_addresses_cells_by_position_and_index():
+    grid = Grid(["123", "456"], digits=True)
+    assert (grid[1, 2], grid[5], grid.index((1, 2)), grid.position(5)) == (
+        6,
+        6,
+        5,
+        (1, 2),
+    )
+    assert grid.get_neighbour_indices(0) == [1, 3]
+
+
+def test_find_cycle_projects_past_the_loop():
+    # 3 -> 6 -> 2 -> 4 -> 1 -> 2 ..., so the loop of 2, 4, 1 starts after two steps
+    step = {3: 6, 6: 2, 2: 4, 4: 1, 1: 2}.get
+    for iterations in range(20):
+        state = 3
+        for _ in range(iterations):
+            state = step(state)
+        result = find_cycle(3, step, iterations)
+        assert result.state == state
+        if iterations >= 5:
+            assert (result.prefix, result.period) == (2, 3)
+
+
+def test_find_cycle_without_a_repeat():
+    assert find_cycle(0, lambda n: n + 1, 10) == (10, 0, 10)
+
+
+def test_find_cycle_with_a_shared_key():
+    # Every state has the same key, so states must be compared in full before calling it a cycle
+    result = find_cycle([0], lambda s: [(s[0] + 1) % 4], 1_000_003, key=lambda s: 0)
+    assert result == (0, 4, [3])
+
+
+def reachable(successors: dict, node) -> set:
+    seen = {node}
+    stack = [node]
+    while stack:
+        for child in successors[stack.pop()]:
+            if child not in seen:
+                seen.add(child)
+                stack.append(child)
+    return seen
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_strongly_connected_components(seed: int):
+    rng = random.Random(seed)
+    nodes = range(rng.randint(1, 30))
+    successors = {
+        node: rng.sample(nodes, rng.randint(0, min(3, len(nodes)))) for node in nodes
+    }
+    components = strongly_connected_components(successors)
+    assert sorted(node for component in components for node in component) == list(nodes)
+    reach = {node: reachable(successors, node) for node in nodes}
+    position = {node: k for k, component in enumerate(components) for node in component}
+    for a in nodes:
+        for b in nodes:
+            mutual = b in reach[a] and a in reach[b]
+            assert (position[a] == position[b]) == mutual
+            # Reverse topological order - whatever a node leads to comes no later
+            if b in reach[a]:
+                assert position[b] <= position[a]
+
+
+def test_strongly_connected_components_deep_chain():
+    successors = {node: [node + 1] for node in range(100_000)}
+    successors[100_000] = [0]
+    assert len(strongly_connected_components(successors)) == 1
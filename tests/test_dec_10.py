@@ -0,0 +1,34 @@
+import pytest
+
+from benchmarks.generators import generate
+from dec_10.dec_10a import EAST, SOUTH, measure_loop, parse_puzzle
+from tests.reference import count_enclosed_by_crossings
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        ["......", ".S-7..", ".|.|..", ".L-J..", "......"],
+        # Pipes off the loop can point at the start as well
+        ["......", "-S-7..", ".|.|..", ".L-J..", "......"],
+        [".|....", "-S-7..", "||.|..", "-L-J..", "......"],
+    ],
+)
+def test_start_shape_follows_the_loop(rows: list[str]):
+    maze = parse_puzzle(rows)
+    assert maze.masks[maze.start] == EAST | SOUTH
+    assert measure_loop(maze) == (8, 1)
+
+
+def test_start_without_a_loop():
+    with pytest.raises(ValueError, match="no two of them close a loop"):
+        parse_puzzle(["-S-", ".|.", "..."])
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_generated_maze_against_crossings(seed: int):
+    maze = parse_puzzle(generate(10, 1, seed))
+    (length, interior) = measure_loop(maze)
+    # The loop should wind across most of the grid rather than skirt round its edge
+    assert length > len(maze.grid) // 2
+    assert interior == count_enclosed_by_crossings(maze)
@@ -0,0 +1,21 @@
+import random
+
+import pytest
+
+from dec_12.dec_12 import count_arrangements, count_all_arrangements, parse_puzzle
+from tests.reference import brute_force_arrangements
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_count_arrangements_matches_brute_force(seed: int):
+    rng = random.Random(seed)
+    conditions = "".join(rng.choices(".#?", weights=[2, 2, 3], k=rng.randint(1, 12)))
+    groups = tuple(rng.randint(1, 4) for _ in range(rng.randint(0, 4)))
+    assert count_arrangements(conditions, groups) == brute_force_arrangements(
+        conditions, groups
+    )
+
+
+def test_unfolded_rows():
+    springs = parse_puzzle(["???.### 1,1,3", ".??..??...?##. 1,1,3"])
+    assert count_all_arrangements(springs, unfold_factor=5) == 1 + 16384
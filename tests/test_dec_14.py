@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from common_functions import transpose_data
+from dec_14.dec_14 import Platform
+from tests.reference import cycle_rocks, move_rocks_as_strings
+
+
+def random_platform(seed: int) -> list[str]:
+    rng = random.Random(seed)
+    (height, width) = (rng.randint(1, 12), rng.randint(1, 12))
+    return [
+        "".join(rng.choices("O#.", weights=[2, 1, 4], k=width)) for _ in range(height)
+    ]
+
+
+def north_load(rows: list[str]) -> int:
+    return sum(row.count("O") * (len(rows) - i) for i, row in enumerate(rows))
+
+
+def east_load(rows: list[str]) -> int:
+    return sum(j + 1 for row in rows for j, char in enumerate(row) if char == "O")
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_spin_cycles_match_the_string_engine(seed: int):
+    rows = random_platform(seed)
+    platform = Platform(rows)
+    state = platform.start
+    for _ in range(5):
+        rows = cycle_rocks(rows)
+        state = platform.spin_cycle(state)
+        assert platform.to_rows(state.rounded) == rows
+        assert (state.north_load, state.east_load) == (
+            north_load(rows),
+            east_load(rows),
+        )
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_tilt_north_matches_the_string_engine(seed: int):
+    rows = random_platform(seed)
+    platform = Platform(rows)
+    state = platform.tilt_north(platform.start)
+    expected = transpose_data(move_rocks_as_strings(transpose_data(rows)))
+    assert platform.to_rows(state.rounded) == expected
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_each_tilt_carries_both_loads(seed: int):
+    platform = Platform(random_platform(seed))
+    state = platform.start
+    for tilt in [platform.tilt_north, platform.tilt_west] * 2 + [
+        platform.tilt_south,
+        platform.tilt_east,
+    ]:
+        state = tilt(state)
+        rows = platform.to_rows(state.rounded)
+        assert (state.north_load, state.east_load) == (
+            north_load(rows),
+            east_load(rows),
+        )
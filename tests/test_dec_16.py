@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from benchmarks.generators import generate
+from dec_16.dec_16 import (
+    Beam,
+    BeamGraph,
+    DIRECTIONS,
+    generate_starting_positions,
+    parse_puzzle,
+    solve_part_2,
+)
+from tests.reference import energise
+
+
+def random_contraption(seed: int) -> list[str]:
+    rng = random.Random(seed)
+    (height, width) = (rng.randint(1, 20), rng.randint(1, 20))
+    weights = [rng.randint(1, 20), 2, 2, 2, 2]
+    return [
+        "".join(rng.choices(".|-/\\", weights=weights, k=width)) for _ in range(height)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_beam_graph_matches_following_each_beam(seed: int):
+    rows = random_contraption(seed)
+    positions = generate_starting_positions(len(rows), len(rows[0]))
+    beams = [Beam(pos, DIRECTIONS[direction]) for pos, direction in positions]
+    expected = [energise(rows, beam.pos, beam.dir) for beam in beams]
+    assert BeamGraph(parse_puzzle(rows)).energised_counts(beams) == expected
+
+
+def test_beam_graph_on_a_generated_grid():
+    # Large enough for the extra tiles of some components to outgrow the limit and go dense
+    rows = generate(16, 10)
+    positions = generate_starting_positions(len(rows), len(rows[0]))[::150]
+    beams = [Beam(pos, DIRECTIONS[direction]) for pos, direction in positions]
+    expected = [energise(rows, beam.pos, beam.dir) for beam in beams]
+    assert BeamGraph(parse_puzzle(rows)).energised_counts(beams) == expected
+
+
+def traced_nodes(graph: BeamGraph) -> dict:
+    return {
+        index: [(list(tiles), end) for tiles, end in segments]
+        for index, segments in graph.nodes.items()
+    }
+
+
+@pytest.mark.parametrize("workers", [2, 3, 8])
+def test_pool_builds_the_same_graph(workers: int):
+    grid = parse_puzzle(generate(16, 10))
+    single = BeamGraph(grid)
+    pooled = BeamGraph(grid, workers)
+    assert traced_nodes(pooled) == traced_nodes(single)
+    assert pooled.components == single.components
+    assert solve_part_2(grid, workers) == solve_part_2(grid, 1)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_pool_on_small_contraptions(seed: int):
+    # Some of these have fewer splitters than shards, or none at all
+    grid = parse_puzzle(random_contraption(seed))
+    assert traced_nodes(BeamGraph(grid, 4)) == traced_nodes(BeamGraph(grid))
+    assert solve_part_2(grid, 4) == solve_part_2(grid, 1)
+
+
+def test_pool_without_splitters():
+    grid = parse_puzzle(["./..", "\\...", "...."])
+    assert BeamGraph(grid, 2).nodes == {}
+    assert solve_part_2(grid, 2) == solve_part_2(grid, 1)
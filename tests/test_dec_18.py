@@ -0,0 +1,15 @@
+from dec_18.dec_18 import load_dig_plan, measure_lagoons, parse_puzzle
+
+
+def test_empty_plan_digs_nothing(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    assert measure_lagoons(load_dig_plan(str(path))) == (0, 0)
+    assert measure_lagoons(parse_puzzle([])) == (0, 0)
+
+
+def test_square_trench():
+    plan = parse_puzzle(
+        ["R 2 (#000030)", "D 2 (#000031)", "L 2 (#000032)", "U 2 (#000033)"]
+    )
+    assert measure_lagoons(plan) == (9, 16)
@@ -0,0 +1,21 @@
+import random
+
+import pytest
+
+from benchmarks.generators import generate
+from dec_5.dec_5a import compose_maps, parse_puzzle
+from tests.reference import walk_maps
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_composed_map_matches_walking_the_maps(seed: int):
+    _, map_blocks = parse_puzzle(generate(5, 1, seed))
+    composed = compose_maps(map_blocks)
+    rng = random.Random(seed)
+    values = [rng.randrange(2**32) for _ in range(2000)]
+    # Every breakpoint and its neighbours, where an off by one would show up
+    for start in composed.breakpoints:
+        values += [max(0, start - 1), start, start + 1]
+    expected = walk_maps(values, map_blocks)
+    assert [composed(value) for value in values] == expected
+    assert composed.map_values(values) == expected
@@ -0,0 +1,60 @@
+"""
+Check every day's solutions give the published answers for the puzzle examples when run through the aoc runner
+"""
+import os
+
+import pytest
+
+from aoc import REPO_ROOT, run_part
+
+EXAMPLES = [
+    (3, "example_a.txt", 1, 4361),
+    (3, "example_a.txt", 2, 467835),
+    (4, "example_a.txt", 1, 13),
+    (4, "example_a.txt", 2, 30),
+    (5, "example.txt", 1, 35),
+    (5, "example.txt", 2, 46),
+    (6, "example.txt", 1, 288),
+    (6, "example.txt", 2, 71503),
+    (7, "example.txt", 1, 6440),
+    (7, "example.txt", 2, 5905),
+    (8, "example_a.txt", 1, 2),
+    (8, "example_b.txt", 1, 6),
+    (8, "example_2.txt", 2, 6),
+    (9, "example.txt", 1, 114),
+    (9, "example.txt", 2, 2),
+    (10, "example.txt", 1, 4),
+    (10, "example2.txt", 1, 8),
+    (10, "example3.txt", 2, 4),
+    (10, "example4.txt", 2, 8),
+    (10, "example5.txt", 2, 10),
+    (11, "example.txt", 1, 374),
+    (11, "example.txt", 2, 82000210),
+    (12, "example.txt", 1, 21),
+    (12, "example.txt", 2, 525152),
+    (13, "example.txt", 1, 405),
+    pytest.param(
+        13,
+        "example.txt",
+        2,
+        400,
+        marks=pytest.mark.xfail(strict=True, reason="part 2 isn't finished yet"),
+    ),
+    (14, "example.txt", 1, 136),
+    (14, "example.txt", 2, 64),
+    (15, "example.txt", 1, 1320),
+    (15, "example.txt", 2, 145),
+    (16, "example.txt", 1, 46),
+    (16, "example.txt", 2, 51),
+    (17, "example.txt", 1, 102),
+    (17, "example.txt", 2, 94),
+    (18, "example.txt", 1, 62),
+    (18, "example.txt", 2, 952408144115),
+]
+
+
+@pytest.mark.parametrize("day, filename, part, answer", EXAMPLES)
+def test_example(day: int, filename: str, part: int, answer: int):
+    timing = run_part(day, part, os.path.join(REPO_ROOT, f"dec_{day}", filename))
+    assert timing.status == "ok"
+    assert timing.answer == answer